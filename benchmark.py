@@ -0,0 +1,269 @@
+import argparse
+import hashlib
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+from typing import Dict, List, Optional, TypeAlias
+
+import runner
+
+DEFAULT_BASELINE_PATH = os.path.join(runner.ROOT_DIR, 'benchmark_baseline.json')
+DEFAULT_REPEATS = 5
+DEFAULT_WARMUP = 1
+# A part regresses when its median is this fraction slower than the baseline...
+DEFAULT_THRESHOLD = 0.25
+# ...and the slowdown is larger than this many seconds (filters timer noise on tiny parts).
+DEFAULT_MIN_DELTA_SECONDS = 0.005
+
+# Timing statistics of one part, keyed as 'parse_median', 'parse_p95', 'solve_median', 'solve_p95'.
+PartStats: TypeAlias = Dict[str, float]
+# Statistics of every benchmarked part, keyed as 'dayXX.part_name' for the bundled
+# input and 'dayXX.part_name@file_name:digest' for any other input file.
+BenchmarkResults: TypeAlias = Dict[str, PartStats]
+
+def percentile(samples: List[float], pct: float) -> float:
+    """
+    Computes a percentile using the nearest-rank method.
+
+    Args:
+        samples: The measured values (must not be empty).
+        pct: The percentile to compute, between 0 and 100.
+
+    Returns:
+        The smallest sample such that at least pct percent of the samples are less or equal.
+    """
+    if not samples:
+        raise ValueError("percentile of empty sample list")
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Returns the median and p95 of a list of timings."""
+    return {
+        'median': statistics.median(samples),
+        'p95': percentile(samples, 95),
+    }
+
+def input_identity(day: int, input_path: Optional[str]) -> str:
+    """
+    Returns the suffix that ties baseline keys to the input they were measured on.
+
+    Timings on a scaled input are not comparable with timings on the bundled one,
+    so any other file gets its own keys, identified by name and content hash.
+
+    Args:
+        day: The day number (1-12).
+        input_path: The input file, or None for the bundled PuzzleInput.txt.
+
+    Returns:
+        An empty string for the bundled input, '@file_name:digest' otherwise.
+    """
+    if input_path is None:
+        return ''
+    if os.path.realpath(input_path) == os.path.realpath(runner.get_default_input_path(day)):
+        return ''
+
+    digest = hashlib.sha256()
+    with open(input_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 20), b''):
+            digest.update(chunk)
+    return f"@{os.path.basename(input_path)}:{digest.hexdigest()[:12]}"
+
+def benchmark_day(day: int, repeats: int = DEFAULT_REPEATS, warmup: int = DEFAULT_WARMUP,
+                  input_path: Optional[str] = None) -> BenchmarkResults:
+    """
+    Runs a day several times and collects timing statistics per part.
+
+    Each repetition re-parses the input, so parse and solve timings get the same
+    number of samples. Warmup runs are executed first and discarded.
+
+    Args:
+        day: The day number (1-12).
+        repeats: Number of measured runs.
+        warmup: Number of discarded runs before measuring.
+        input_path: Optional input file, defaults to the bundled PuzzleInput.txt.
+
+    Returns:
+        The timing statistics of every part of the day.
+    """
+    if repeats < 1:
+        raise ValueError("repeats must be at least 1")
+    suffix = input_identity(day, input_path)
+
+    for _ in range(warmup):
+        runner.run_day(day, input_path)
+
+    parse_samples: Dict[str, List[float]] = {}
+    solve_samples: Dict[str, List[float]] = {}
+    for _ in range(repeats):
+        for report in runner.run_day(day, input_path):
+            key = f"day{day:02d}.{report['part']}{suffix}"
+            parse_samples.setdefault(key, []).append(report['parse_seconds'])
+            solve_samples.setdefault(key, []).append(report['solve_seconds'])
+
+    results: BenchmarkResults = {}
+    for key in parse_samples:
+        parse_stats = summarize(parse_samples[key])
+        solve_stats = summarize(solve_samples[key])
+        results[key] = {
+            'parse_median': parse_stats['median'],
+            'parse_p95': parse_stats['p95'],
+            'solve_median': solve_stats['median'],
+            'solve_p95': solve_stats['p95'],
+        }
+    return results
+
+def save_baseline(results: BenchmarkResults, path: str, repeats: int, warmup: int) -> None:
+    """
+    Writes benchmark results to a JSON baseline file.
+
+    Parts already present in the file but not benchmarked this time are kept,
+    so the baseline can be refreshed one day at a time.
+
+    Args:
+        results: The freshly measured statistics.
+        path: The baseline file path.
+        repeats: Number of measured runs (recorded as metadata).
+        warmup: Number of warmup runs (recorded as metadata).
+    """
+    baseline = load_baseline(path) if os.path.exists(path) else {}
+    baseline.update(results)
+
+    document = {
+        'meta': {
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'repeats': repeats,
+            'warmup': warmup,
+        },
+        'parts': dict(sorted(baseline.items())),
+    }
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(document, file, indent=2)
+        file.write('\n')
+
+def load_baseline(path: str) -> BenchmarkResults:
+    """
+    Reads the per-part statistics from a baseline file.
+
+    Args:
+        path: The baseline file path.
+
+    Returns:
+        The stored statistics, keyed like BenchmarkResults.
+    """
+    with open(path, 'r', encoding='utf-8') as file:
+        return json.load(file)['parts']
+
+def find_regressions(results: BenchmarkResults, baseline: BenchmarkResults,
+                     threshold: float = DEFAULT_THRESHOLD,
+                     min_delta_seconds: float = DEFAULT_MIN_DELTA_SECONDS) -> List[str]:
+    """
+    Compares fresh results against a baseline.
+
+    Both the parse and the solve medians are checked. Parts missing from the
+    baseline are ignored.
+
+    Args:
+        results: The freshly measured statistics.
+        baseline: The stored statistics.
+        threshold: Allowed relative slowdown (0.25 means 25% slower).
+        min_delta_seconds: Slowdowns smaller than this are never reported.
+
+    Returns:
+        A human-readable message per regression (empty if none).
+    """
+    regressions: List[str] = []
+    for key, stats in sorted(results.items()):
+        if key not in baseline:
+            continue
+        for phase in ('parse', 'solve'):
+            current = stats[f'{phase}_median']
+            reference = baseline[key][f'{phase}_median']
+            if current > reference * (1 + threshold) and current - reference > min_delta_seconds:
+                regressions.append(
+                    f"{key} {phase}: {reference * 1000:.2f} ms -> {current * 1000:.2f} ms "
+                    f"(+{(current / reference - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+def format_results(results: BenchmarkResults, baseline: Optional[BenchmarkResults] = None) -> str:
+    """Formats benchmark statistics (and baseline medians if given) as a plain-text table."""
+    headers = ['Part', 'Parse med (ms)', 'Parse p95 (ms)', 'Solve med (ms)', 'Solve p95 (ms)', 'Baseline solve (ms)']
+    rows = []
+    for key, stats in sorted(results.items()):
+        reference = baseline.get(key) if baseline else None
+        rows.append([
+            key,
+            f"{stats['parse_median'] * 1000:.2f}",
+            f"{stats['parse_p95'] * 1000:.2f}",
+            f"{stats['solve_median'] * 1000:.2f}",
+            f"{stats['solve_p95'] * 1000:.2f}",
+            f"{reference['solve_median'] * 1000:.2f}" if reference else '-',
+        ])
+
+    return runner.format_columns(headers, rows)
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark Advent of Code 2025 solutions against a stored baseline.")
+    parser.add_argument('days', nargs='*', type=int, default=runner.ALL_DAYS,
+                        help="Days to benchmark (default: all).")
+    parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS,
+                        help=f"Measured runs per day (default: {DEFAULT_REPEATS}).")
+    parser.add_argument('--warmup', type=int, default=DEFAULT_WARMUP,
+                        help=f"Discarded runs per day (default: {DEFAULT_WARMUP}).")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE_PATH,
+                        help="Baseline JSON file (default: benchmark_baseline.json).")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Allowed relative slowdown (default: {DEFAULT_THRESHOLD}).")
+    parser.add_argument('--update', action='store_true',
+                        help="Write the results to the baseline instead of comparing.")
+    parser.add_argument('--input', dest='input_path',
+                        help="Alternative input file (requires exactly one day; kept under its own baseline keys).")
+    args = parser.parse_args(argv)
+
+    unknown_days = [day for day in args.days if day not in runner.DAY_SPECS]
+    if unknown_days:
+        parser.error(f"unknown days: {unknown_days}")
+    if args.input_path and len(args.days) != 1:
+        parser.error("--input requires exactly one day")
+    return args
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Benchmarks the selected days and compares them with the baseline.
+
+    Returns:
+        The process exit code: 1 if any part regressed, 0 otherwise.
+    """
+    args = parse_args(argv)
+
+    results: BenchmarkResults = {}
+    for day in args.days:
+        results.update(benchmark_day(day, args.repeats, args.warmup, args.input_path))
+
+    if args.update or not os.path.exists(args.baseline):
+        save_baseline(results, args.baseline, args.repeats, args.warmup)
+        print(format_results(results))
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    print(format_results(results, baseline))
+
+    regressions = find_regressions(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}:")
+        for message in regressions:
+            print(f"  {message}")
+        return 1
+
+    print("\nNo regressions.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
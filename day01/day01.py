@@ -1,7 +1,14 @@
 
 import os
+import string
 import sys
-from typing import Callable
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from itertools import accumulate, compress, islice, repeat
+from operator import floordiv, lt, mod, not_, sub
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple, TypeAlias, Union
 
 # Add parent directory to path to import utils
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -9,6 +16,18 @@ import utils
 
 DIAL_START_POS = 50
 DIAL_SIZE = 100
+# Moves per batch in count_times_dial_passed_zero_vectorized, bounding its temporary lists
+VECTOR_CHUNK_MOVES = 1 << 16
+
+# Bytes removed from the raw input to keep only the direction letters, or only the distances
+_NON_DIRECTION_BYTES = (string.digits + string.whitespace).encode('ascii')
+_LETTER_BYTES = string.ascii_letters.encode('ascii')
+# Turns each move into a signed integer literal: left letters become '-', right letters are deleted
+_SIGN_TABLE = bytes.maketrans(_LETTER_BYTES, b'-' * len(_LETTER_BYTES))
+_RIGHT_BYTES = b'Rr'
+
+# (net displacement, zero landings per start offset, zero clicks per start offset)
+SegmentSummary: TypeAlias = Tuple[int, List[int], List[int]]
 
 script_dir = os.path.dirname(os.path.abspath(__file__))
 INPUT_FILE_PATH = os.path.join(script_dir, 'PuzzleInput.txt')
@@ -74,12 +93,12 @@ def get_position_after_move(position: int, move: str) -> tuple[int, int]:
             
     return new_position, crossings
 
-def count_times_dial_at_zero(dial_start_pos: int, moves: list[str]) -> int:
+def count_times_dial_at_zero(dial_start_pos: int, moves: Iterable[str]) -> int:
     """Calculates how many times the dial lands exactly on position 0 after a sequence of moves.
 
     Args:
         dial_start_pos (int): The initial position of the dial (0-99).
-        moves (list[str]): A list of move strings (e.g., ["R31", "L49"]).
+        moves (Iterable[str]): Move strings (e.g., ["R31", "L49"]), consumed once in order.
 
     Returns:
         int: The total count of times the dial is at position 0 after each move.
@@ -97,14 +116,14 @@ def count_times_dial_at_zero(dial_start_pos: int, moves: list[str]) -> int:
             
     return times_at_zero_counter
 
-def count_times_dial_passed_zero(dial_start_pos: int, moves: list[str]) -> int:
+def count_times_dial_passed_zero(dial_start_pos: int, moves: Iterable[str]) -> int:
     """Calculates the total number of times the dial passes over position 0 across all moves.
 
     This includes any clicks on 0 that occur *during* a rotation, not just at the end.
 
     Args:
         dial_start_pos (int): The initial position of the dial (0-99).
-        moves (list[str]): A list of move strings (e.g., ["R31", "L49"]).
+        moves (Iterable[str]): Move strings (e.g., ["R31", "L49"]), consumed once in order.
 
     Returns:
         int: The total count of times the dial registers a click on zero.
@@ -121,45 +140,342 @@ def count_times_dial_passed_zero(dial_start_pos: int, moves: list[str]) -> int:
             
     return times_passed_zero_counter
 
-def part01(input_lines: list[str]):
+def get_signed_distances(moves: Iterable[str]) -> array:
+    """Parses all moves into one array of signed distances.
+
+    Args:
+        moves (Iterable[str]): Move strings (e.g., ["R31", "L49"]).
+
+    Returns:
+        array: A signed 64-bit integer array, positive for 'R' moves and
+               negative for 'L' moves (e.g., [31, -49]).
+
+    Raises:
+        ValueError: If a move string is empty.
+    """
+    signed_distances = array('q')
+    for move in moves:
+        direction, distance = get_rot_dir_and_distance(move)
+        signed_distances.append(distance if direction == 'R' else -distance)
+    return signed_distances
+
+def _count_moves(data: bytes) -> int:
+    """Counts the lines of a raw move log, checking that each one holds a direction.
+
+    Raises:
+        ValueError: If a line holds no move.
+    """
+    num_lines = data.count(b'\n')
+    if data and not data.endswith(b'\n'):
+        num_lines += 1
+    if len(data.translate(None, _NON_DIRECTION_BYTES)) != num_lines:
+        raise ValueError("empty move string")
+    return num_lines
+
+def parse_moves_bytes(data: bytes) -> Tuple[bytes, array]:
+    """Parses a whole move log from its raw bytes without building a str per line.
+
+    The directions are the letters left after deleting digits and whitespace.
+    The distances are the tokens left after deleting letters. Each comes from
+    a single bytes.translate pass over the buffer.
+
+    Args:
+        data (bytes): The raw input, one move per line (e.g., b"R31\nL49\n").
+
+    Returns:
+        tuple[bytes, array]: The direction bytes (e.g., b"RL") and a signed
+                             64-bit integer array of the distances (e.g., [31, 49]).
+
+    Raises:
+        ValueError: If a line holds no move (or a move without a distance).
+    """
+    num_lines = _count_moves(data)
+    directions = data.translate(None, _NON_DIRECTION_BYTES)
+    distances = array('q', map(int, data.translate(None, _LETTER_BYTES).split()))
+    if len(distances) != num_lines:
+        raise ValueError("move string without a distance")
+
+    return directions, distances
+
+def get_signed_distances_from_bytes(data: bytes) -> array:
+    """Parses a raw move log straight into signed distances.
+
+    Same result as get_signed_distances on the decoded lines. Right letters
+    are deleted and every other letter becomes a minus sign, so one translate
+    turns the buffer into signed integer literals (e.g., b"R31\nL49" -> b"31\n-49").
+
+    Args:
+        data (bytes): The raw input, one move per line.
+
+    Returns:
+        array: A signed 64-bit integer array, positive for 'R' moves and
+               negative for 'L' moves.
+
+    Raises:
+        ValueError: If a line holds no move.
+    """
+    signed_distances = array('q')
+    _extend_signed_distances(signed_distances, data)
+    return signed_distances
+
+def _extend_signed_distances(signed_distances: array, data: bytes) -> None:
+    """Appends the signed distances of a block of whole move lines to an array.
+
+    Raises:
+        ValueError: If a line holds no move (or a move without a distance).
+    """
+    num_lines = _count_moves(data)
+    num_parsed = len(signed_distances)
+    signed_distances.extend(map(int, data.translate(_SIGN_TABLE, _RIGHT_BYTES).split()))
+    if len(signed_distances) - num_parsed != num_lines:
+        raise ValueError("move string without a distance")
+
+def read_signed_distances(file_path: str, chunk_size: int = utils.DEFAULT_CHUNK_SIZE) -> array:
+    """Parses a move log file into signed distances, one line-aligned chunk at a time.
+
+    Same result as get_signed_distances_from_bytes on the whole file, but only
+    one chunk of raw bytes (and its translated copy) is alive at a time, so
+    the peak memory is the output array plus O(chunk_size).
+
+    Args:
+        file_path (str): The path to the input file, one move per line.
+        chunk_size (int): The approximate number of bytes parsed per chunk.
+
+    Returns:
+        array: A signed 64-bit integer array, positive for 'R' moves and
+               negative for 'L' moves.
+
+    Raises:
+        ValueError: If a line holds no move.
+    """
+    signed_distances = array('q')
+    for chunk in utils.iter_input_line_chunks(file_path, chunk_size):
+        _extend_signed_distances(signed_distances, chunk)
+    return signed_distances
+
+def _as_signed_distances(moves: Union[array, bytes, Iterable[str]]) -> array:
+    """Parses moves given as raw input bytes or move strings (parsed arrays pass through)."""
+    if isinstance(moves, array):
+        return moves
+    if isinstance(moves, (bytes, bytearray)):
+        return get_signed_distances_from_bytes(moves)
+    return get_signed_distances(moves)
+
+def count_times_dial_at_zero_vectorized(dial_start_pos: int, signed_distances: Sequence[int]) -> int:
+    """Counts the zero landings of a whole move sequence with bulk operations.
+
+    Same result as count_times_dial_at_zero. The unwrapped dial positions are
+    the prefix sums of the signed distances, and a move lands on zero when its
+    unwrapped end position is a multiple of DIAL_SIZE. Every step runs inside
+    itertools/operator builtins instead of a per-move Python loop.
+
+    Args:
+        dial_start_pos (int): The initial position of the dial (0-99).
+        signed_distances (Sequence[int]): Output of get_signed_distances.
+
+    Returns:
+        int: The total count of times the dial is at position 0 after each move.
+    """
+    positions = accumulate(signed_distances, initial=dial_start_pos)
+    end_positions = islice(positions, 1, None)
+    return sum(map(not_, map(mod, end_positions, repeat(DIAL_SIZE))))
+
+def count_times_dial_passed_zero_vectorized(dial_start_pos: int, signed_distances: Sequence[int]) -> int:
+    """Counts the zero clicks of a whole move sequence with bulk operations.
+
+    Same result as count_times_dial_passed_zero for non-negative distances.
+    With unwrapped positions p -> q, a right move clicks on zero
+    q // DIAL_SIZE - p // DIAL_SIZE times. A left move clicks the same number
+    of times, measured downwards, except that it counts a zero it lands on
+    and not the zero it starts from. So the total is the sum of
+    |floor difference| plus, for left moves only, (lands on zero) - (starts on zero).
+    The moves are processed in batches of VECTOR_CHUNK_MOVES, carrying the
+    position across batches, so the temporary lists stay a fixed size.
+
+    Args:
+        dial_start_pos (int): The initial position of the dial (0-99).
+        signed_distances (Sequence[int]): Output of get_signed_distances.
+
+    Returns:
+        int: The total count of times the dial registers a click on zero.
+    """
+    position = dial_start_pos
+    crossings = 0
+    for begin in range(0, len(signed_distances), VECTOR_CHUNK_MOVES):
+        batch = signed_distances[begin:begin + VECTOR_CHUNK_MOVES]
+        positions = list(accumulate(batch, initial=position))
+        floors = list(map(floordiv, positions, repeat(DIAL_SIZE)))
+        at_zero = list(map(not_, map(mod, positions, repeat(DIAL_SIZE))))
+        is_left = list(map(lt, batch, repeat(0)))
+
+        crossings += sum(map(abs, map(sub, islice(floors, 1, None), floors)))
+        crossings += sum(compress(islice(at_zero, 1, None), is_left))
+        crossings -= sum(compress(at_zero, is_left))
+        position = positions[-1]
+    return crossings
+
+def _suffix_counts(histogram: Counter) -> List[int]:
+    """Returns counts[t] = number of residues >= t, for t in 0..DIAL_SIZE."""
+    counts = [0] * (DIAL_SIZE + 1)
+    for residue in range(DIAL_SIZE - 1, -1, -1):
+        counts[residue] = counts[residue + 1] + histogram[residue]
+    return counts
+
+def summarize_segment(signed_distances: Sequence[int]) -> SegmentSummary:
+    """Summarizes the effect of a run of moves for every possible start offset.
+
+    Positions are tracked relative to the segment start. For a start offset s,
+    an unwrapped position x becomes s + x. Its floor (s + x) // DIAL_SIZE gains
+    one exactly when x % DIAL_SIZE >= DIAL_SIZE - s, and it sits on zero
+    exactly when x % DIAL_SIZE == (DIAL_SIZE - s) % DIAL_SIZE. So the landings
+    and clicks for all DIAL_SIZE offsets come from a few residue histograms.
+    Building those histograms is bulk work over the segment, with the same
+    formulas as count_times_dial_passed_zero_vectorized.
+
+    Args:
+        signed_distances (Sequence[int]): Signed distances of consecutive moves.
+
+    Returns:
+        SegmentSummary: (net displacement, landings, clicks), where landings[s]
+                        and clicks[s] are the counts when the segment starts at
+                        dial offset s.
+    """
+    positions = list(accumulate(signed_distances, initial=0))
+    floors = list(map(floordiv, positions, repeat(DIAL_SIZE)))
+    residues = list(map(mod, positions, repeat(DIAL_SIZE)))
+    is_left = list(map(lt, signed_distances, repeat(0)))
+    is_right = list(map(not_, is_left))
+
+    base_clicks = sum(map(abs, map(sub, islice(floors, 1, None), floors)))
+    end_residues = residues[1:]
+    landed = Counter(end_residues)
+    right_ends = _suffix_counts(Counter(compress(end_residues, is_right)))
+    right_starts = _suffix_counts(Counter(compress(residues, is_right)))
+    left_end_hist = Counter(compress(end_residues, is_left))
+    left_start_hist = Counter(compress(residues, is_left))
+    left_ends = _suffix_counts(left_end_hist)
+    left_starts = _suffix_counts(left_start_hist)
+
+    landings = []
+    clicks = []
+    for offset in range(DIAL_SIZE):
+        threshold = DIAL_SIZE - offset
+        zero_residue = threshold % DIAL_SIZE
+        landings.append(landed[zero_residue])
+        clicks.append(base_clicks
+                      + right_ends[threshold] - right_starts[threshold]
+                      + left_starts[threshold] - left_ends[threshold]
+                      + left_end_hist[zero_residue] - left_start_hist[zero_residue])
+
+    return positions[-1], landings, clicks
+
+def combine_segments(first: SegmentSummary, second: SegmentSummary) -> SegmentSummary:
+    """Merges the summaries of two consecutive move segments.
+
+    The operation is associative, so segment summaries can be computed
+    independently and folded in order.
+
+    Args:
+        first (SegmentSummary): Summary of the earlier segment.
+        second (SegmentSummary): Summary of the segment that follows it.
+
+    Returns:
+        SegmentSummary: The summary of both segments played back to back.
+    """
+    first_net, first_landings, first_clicks = first
+    second_net, second_landings, second_clicks = second
+    shift = first_net % DIAL_SIZE
+    landings = [first_landings[s] + second_landings[(s + shift) % DIAL_SIZE] for s in range(DIAL_SIZE)]
+    clicks = [first_clicks[s] + second_clicks[(s + shift) % DIAL_SIZE] for s in range(DIAL_SIZE)]
+    return first_net + second_net, landings, clicks
+
+def count_dial_zeros_parallel(dial_start_pos: int, signed_distances: Sequence[int],
+                              workers: Optional[int] = None,
+                              chunk_size: Optional[int] = None) -> Tuple[int, int]:
+    """Computes both dial counts by summarizing chunks of moves on a process pool.
+
+    Each chunk is summarized independently with summarize_segment, then the
+    summaries are combined in order. The results are exactly those of
+    count_times_dial_at_zero and count_times_dial_passed_zero.
+
+    Args:
+        dial_start_pos (int): The initial position of the dial (0-99).
+        signed_distances (Sequence[int]): Output of get_signed_distances.
+        workers (Optional[int]): Number of worker processes (default: CPU count).
+        chunk_size (Optional[int]): Moves per chunk (default: four chunks per worker).
+
+    Returns:
+        tuple[int, int]: (times the dial lands on zero, times it clicks on zero).
+    """
+    workers = workers or os.cpu_count() or 1
+    num_moves = len(signed_distances)
+    if chunk_size is None:
+        chunk_size = max(1, -(-num_moves // (workers * 4)))
+    chunks = [signed_distances[i:i + chunk_size] for i in range(0, num_moves, chunk_size)]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        summaries = list(executor.map(summarize_segment, chunks))
+
+    identity: SegmentSummary = (0, [0] * DIAL_SIZE, [0] * DIAL_SIZE)
+    _, landings, clicks = reduce(combine_segments, summaries, identity)
+    start_offset = dial_start_pos % DIAL_SIZE
+    return landings[start_offset], clicks[start_offset]
+
+def part01(input_lines: Union[array, bytes, Iterable[str]], workers: Optional[int] = None):
     """Executes Part 1 of the Advent of Code Day 1 puzzle.
 
     Calculates the number of times the dial is at zero and prints the result.
 
     Args:
-        input_lines (list[str]): The list of move instructions.
+        input_lines (Union[array, bytes, Iterable[str]]): The move instructions, either
+            already parsed signed distances, the raw input bytes or move strings
+            (a list or a lazy line iterator).
+        workers (Optional[int]): Number of worker processes to opt into (default: serial).
+            Summarizing a segment costs several times the vectorized count, so the
+            pool only pays off with many cores.
     """
 
     print("Advent of Code 2025 - Day 1 - Part 1")
     dial_start_pos = DIAL_START_POS
-    times_at_zero = count_times_dial_at_zero(dial_start_pos, input_lines)
+    signed_distances = _as_signed_distances(input_lines)
+    if workers is not None and workers > 1:
+        times_at_zero, _ = count_dial_zeros_parallel(dial_start_pos, signed_distances, workers)
+    else:
+        times_at_zero = count_times_dial_at_zero_vectorized(dial_start_pos, signed_distances)
     print(f"Time of Dial at Zero position: {times_at_zero}")
 
-def part02(input_lines: list[str]):
+def part02(input_lines: Union[array, bytes, Iterable[str]], workers: Optional[int] = None):
     """Executes Part 2 of the Advent of Code Day 1 puzzle.
 
     Calculates the number of times the dial passes over zero and prints the result.
 
     Args:
-        input_lines (list[str]): The list of move instructions.
+        input_lines (Union[array, bytes, Iterable[str]]): The move instructions, either
+            already parsed signed distances, the raw input bytes or move strings
+            (a list or a lazy line iterator).
+        workers (Optional[int]): Number of worker processes to opt into (default: serial).
     """
     print("Advent of Code 2025 - Day 1 - Part 2")
     dial_start_pos = DIAL_START_POS
-    times_passed_zero = count_times_dial_passed_zero(dial_start_pos, input_lines)
+    signed_distances = _as_signed_distances(input_lines)
+    if workers is not None and workers > 1:
+        _, times_passed_zero = count_dial_zeros_parallel(dial_start_pos, signed_distances, workers)
+    else:
+        times_passed_zero = count_times_dial_passed_zero_vectorized(dial_start_pos, signed_distances)
     print(f"Time of Dial passed Zero position: {times_passed_zero}")
 
 def main():
     """Main function to run the Advent of Code Day 1 solutions.
-    Parse Input file and
+    Parses the Input file once and
     Calls Part 1 and Part 2 functions.
     """
 
-    # Parse Input file
-    input_lines = utils.read_input_file(INPUT_FILE_PATH)
-    
-    part01(input_lines)
+    # Parse the Input file chunk by chunk into one array of signed distances
+    signed_distances = read_signed_distances(INPUT_FILE_PATH)
+
+    part01(signed_distances)
     
-    part02(input_lines)
+    part02(signed_distances)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 import unittest
 import os
+import random
 import sys
 
 # Add current directory to path so we can import day01
@@ -29,6 +30,102 @@ class TestDay01(unittest.TestCase):
         # Start 50. R50 -> 0. R100 -> 0.
         self.assertEqual(day01.count_times_dial_at_zero(50, ["R50", "R100"]), 2)
 
+    def test_counts_from_streamed_lines(self):
+        # Lazily streamed lines must give the same counts as the materialised list
+        input_lines = day01.utils.read_input_file(day01.INPUT_FILE_PATH)
+        streamed = day01.utils.iter_input_lines(day01.INPUT_FILE_PATH)
+        self.assertEqual(day01.count_times_dial_at_zero(50, streamed),
+                         day01.count_times_dial_at_zero(50, input_lines))
+
+    def test_iter_input_line_chunks(self):
+        # Small chunks must split only on line boundaries and cover the whole file
+        with open(day01.INPUT_FILE_PATH, 'rb') as file:
+            raw = file.read()
+        chunks = list(day01.utils.iter_input_line_chunks(day01.INPUT_FILE_PATH, chunk_size=64))
+        self.assertEqual(b''.join(chunks), raw)
+        for chunk in chunks[:-1]:
+            self.assertTrue(chunk.endswith(b'\n'))
+
+    def test_get_signed_distances(self):
+        self.assertEqual(list(day01.get_signed_distances(["R5", "L10", "r0"])), [5, -10, 0])
+        with self.assertRaises(ValueError):
+            day01.get_signed_distances(["R5", ""])
+
+    def test_parse_moves_bytes(self):
+        directions, distances = day01.parse_moves_bytes(b"R31\nL49\r\nr5\nL100")
+        self.assertEqual(directions, b"RLrL")
+        self.assertEqual(list(distances), [31, 49, 5, 100])
+        self.assertEqual(list(day01.get_signed_distances_from_bytes(b"R31\nL49\nr5\n")), [31, -49, 5])
+        self.assertEqual(list(day01.get_signed_distances_from_bytes(b"")), [])
+        with self.assertRaises(ValueError):
+            day01.parse_moves_bytes(b"R31\n\nL49\n")
+        with self.assertRaises(ValueError):
+            day01.parse_moves_bytes(b"R31\nL\n")
+
+    def test_signed_distances_from_bytes_match_lines(self):
+        input_lines = day01.utils.read_input_file(day01.INPUT_FILE_PATH)
+        input_data = day01.utils.read_input_bytes(day01.INPUT_FILE_PATH)
+        self.assertEqual(day01.get_signed_distances_from_bytes(input_data),
+                         day01.get_signed_distances(input_lines))
+
+    def test_read_signed_distances(self):
+        # Small chunks must parse to the same array as the whole file at once
+        input_data = day01.utils.read_input_bytes(day01.INPUT_FILE_PATH)
+        self.assertEqual(day01.read_signed_distances(day01.INPUT_FILE_PATH, chunk_size=64),
+                         day01.get_signed_distances_from_bytes(input_data))
+
+    def test_vectorized_counts_match_loop(self):
+        # Random moves with large distances, including exact multiples of the dial size
+        rng = random.Random(1)
+        moves = [f"{rng.choice('LR')}{rng.choice([0, 100, 250, rng.randint(1, 999)])}" for _ in range(2000)]
+        moves += day01.utils.read_input_file(day01.INPUT_FILE_PATH)
+        for start in (0, 50, 99):
+            signed_distances = day01.get_signed_distances(moves)
+            self.assertEqual(day01.count_times_dial_at_zero_vectorized(start, signed_distances),
+                             day01.count_times_dial_at_zero(start, moves))
+            self.assertEqual(day01.count_times_dial_passed_zero_vectorized(start, signed_distances),
+                             day01.count_times_dial_passed_zero(start, moves))
+
+    def test_passed_zero_batches_match_single_batch(self):
+        # Batch boundaries must carry the position over exactly
+        rng = random.Random(3)
+        signed_distances = [rng.choice([-1, 1]) * rng.choice([0, 100, rng.randint(1, 999)]) for _ in range(1000)]
+        expected = day01.count_times_dial_passed_zero_vectorized(50, signed_distances)
+        original_chunk = day01.VECTOR_CHUNK_MOVES
+        try:
+            day01.VECTOR_CHUNK_MOVES = 7
+            self.assertEqual(day01.count_times_dial_passed_zero_vectorized(50, signed_distances), expected)
+        finally:
+            day01.VECTOR_CHUNK_MOVES = original_chunk
+
+    def test_combined_segment_summaries_match_loop(self):
+        rng = random.Random(2)
+        moves = [f"{rng.choice('LR')}{rng.choice([0, 100, rng.randint(1, 999)])}" for _ in range(500)]
+        signed_distances = day01.get_signed_distances(moves)
+        # Any split point must give the same counts for every start offset
+        first = day01.summarize_segment(signed_distances[:123])
+        second = day01.summarize_segment(signed_distances[123:])
+        _, landings, clicks = day01.combine_segments(first, second)
+        for start in range(day01.DIAL_SIZE):
+            self.assertEqual(landings[start], day01.count_times_dial_at_zero(start, moves))
+            self.assertEqual(clicks[start], day01.count_times_dial_passed_zero(start, moves))
+
+    def test_count_dial_zeros_parallel(self):
+        input_lines = day01.utils.read_input_file(day01.INPUT_FILE_PATH)
+        signed_distances = day01.get_signed_distances(input_lines)
+        expected = (day01.count_times_dial_at_zero(50, input_lines),
+                    day01.count_times_dial_passed_zero(50, input_lines))
+        self.assertEqual(day01.count_dial_zeros_parallel(50, signed_distances, workers=2, chunk_size=1000), expected)
+
+    def test_parts_with_workers(self):
+        # The pool is opt-in; asking for it must not change the printed answers
+        signed_distances = day01.read_signed_distances(day01.INPUT_FILE_PATH)
+        try:
+            day01.part01(signed_distances, workers=2)
+            day01.part02(signed_distances, workers=2)
+        except Exception as e:
+            self.fail(f"parts with workers raised {e} unexpectedly!")
+
     def test_part01_execution(self):
         # Explicitly test part01 with real input
         input_lines = day01.utils.read_input_file(day01.INPUT_FILE_PATH)
@@ -1,6 +1,11 @@
 
 import os
 import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, combinations, repeat
+from math import prod
 from typing import Callable
 
 # Add parent directory to path to import utils
@@ -11,6 +16,12 @@ import utils
 script_dir = os.path.dirname(os.path.abspath(__file__))
 INPUT_FILE_PATH = os.path.join(script_dir, 'PuzzleInput.txt')
 
+# Periodic-number index: default digit bound (covers the puzzle ranges), largest bound whose
+# prefix sums still fit in 64 bits, and the directory the built indexes are cached in
+DEFAULT_INDEX_DIGITS = 10
+MAX_INDEX_DIGITS = 12
+INDEX_CACHE_DIR = os.path.join(script_dir, '.cache')
+
 def split_by_comma(input_str: str) -> list[str]:
     """Splits a string by commas and strips whitespace from each resulting substring.
 
@@ -53,6 +64,23 @@ def parse_all_ranges(ranges_list: list[str]) -> list[tuple[int, int]]:
     """
     return [parse_range(range_str) for range_str in ranges_list]
 
+def merge_ranges(value_pairs: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Sorts and merges overlapping or adjacent inclusive ranges, so no value is visited twice.
+
+    Args:
+        value_pairs (list[tuple[int, int]]): A list of (start, end) tuples.
+
+    Returns:
+        list[tuple[int, int]]: The merged (start, end) tuples in increasing order.
+    """
+    merged = []
+    for start, end in sorted(value_pairs):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [tuple(pair) for pair in merged]
+
 def is_value_invalid_part1(value: int) -> bool:
     """Checks if a value is invalid by Part 1 rules (a sequence repeated exactly twice).
     
@@ -95,16 +123,186 @@ def is_value_invalid_part2(value: int) -> bool:
                 return True
     return False
 
-def calculate_total_invalid(value_pairs: list[tuple[int, int]], is_invalid_func: Callable[[int], bool]) -> int:
+class PeriodicIndex:
+    """Sorted arrays of every invalid ID below 10^max_digits, with prefix sums.
+
+    With the prefix sums, the sum of the invalid IDs in [start, end] takes
+    two bisects, for both the Part 1 and the Part 2 rules.
+    """
+
+    def __init__(self, max_digits: int, part1_values: array, part2_values: array):
+        """Builds the prefix sums of already sorted value arrays.
+
+        Args:
+            max_digits (int): The digit bound the values were generated for.
+            part1_values (array): Sorted values invalid by Part 1 rules.
+            part2_values (array): Sorted values invalid by Part 2 rules.
+        """
+        self.max_digits = max_digits
+        self.part1_values = part1_values
+        self.part2_values = part2_values
+        self.part1_prefix = array('q', accumulate(part1_values, initial=0))
+        self.part2_prefix = array('q', accumulate(part2_values, initial=0))
+
+    @classmethod
+    def build(cls, max_digits: int = DEFAULT_INDEX_DIGITS) -> 'PeriodicIndex':
+        """Generates every repeated-block number with at most max_digits digits.
+
+        Args:
+            max_digits (int): The digit bound (at most MAX_INDEX_DIGITS).
+
+        Returns:
+            PeriodicIndex: The new index.
+
+        Raises:
+            ValueError: If max_digits is outside 1..MAX_INDEX_DIGITS.
+        """
+        if not 1 <= max_digits <= MAX_INDEX_DIGITS:
+            raise ValueError(f"max_digits must be between 1 and {MAX_INDEX_DIGITS}: {max_digits}")
+
+        part1_values = array('q')
+        part2_values = array('q')
+        for num_digits in range(2, max_digits + 1):
+            values = set()
+            for prime in prime_factors(num_digits):
+                period = num_digits // prime
+                multiplier = (10 ** num_digits - 1) // (10 ** period - 1)
+                values.update(range(10 ** (period - 1) * multiplier, 10 ** period * multiplier, multiplier))
+            part2_values.extend(sorted(values))
+            if num_digits % 2 == 0:
+                multiplier = 10 ** (num_digits // 2) + 1
+                part1_values.extend(range(10 ** (num_digits // 2 - 1) * multiplier,
+                                          10 ** (num_digits // 2) * multiplier, multiplier))
+        return cls(max_digits, part1_values, part2_values)
+
+    @classmethod
+    def load(cls, path: str) -> 'PeriodicIndex':
+        """Reads an index written by save.
+
+        Args:
+            path (str): The index file.
+
+        Returns:
+            PeriodicIndex: The loaded index.
+
+        Raises:
+            ValueError: If the header is invalid or the file size does not match it.
+        """
+        item_size = array('q').itemsize
+        file_size = os.path.getsize(path)
+        with open(path, 'rb') as file:
+            header = array('q')
+            try:
+                header.fromfile(file, 3)
+            except EOFError:
+                raise ValueError(f"truncated periodic index header: {path}") from None
+            max_digits, part1_count, part2_count = header
+            if not 1 <= max_digits <= MAX_INDEX_DIGITS or part1_count < 0 or part2_count < 0:
+                raise ValueError(f"invalid periodic index header: {path}")
+            if file_size != item_size * (3 + part1_count + part2_count):
+                raise ValueError(f"periodic index size does not match its header: {path}")
+            part1_values = array('q')
+            part1_values.fromfile(file, part1_count)
+            part2_values = array('q')
+            part2_values.fromfile(file, part2_count)
+        return cls(max_digits, part1_values, part2_values)
+
+    def save(self, path: str) -> None:
+        """Writes the value arrays to a binary file (the prefix sums are rebuilt on load).
+
+        The data goes to a temporary file in the same directory, which then
+        replaces path, so readers never see a partially written index.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        try:
+            with open(temp_path, 'wb') as file:
+                array('q', [self.max_digits, len(self.part1_values), len(self.part2_values)]).tofile(file)
+                self.part1_values.tofile(file)
+                self.part2_values.tofile(file)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def covers(self, value_pairs: list[tuple[int, int]]) -> bool:
+        """Tells whether every range lies below 10^max_digits."""
+        limit = 10 ** self.max_digits
+        return all(end < limit for _, end in value_pairs)
+
+    def sum_part1(self, start: int, end: int) -> int:
+        """Sums the values of [start, end] that are invalid by Part 1 rules."""
+        return _sum_sorted_in_range(self.part1_values, self.part1_prefix, start, end)
+
+    def sum_part2(self, start: int, end: int) -> int:
+        """Sums the values of [start, end] that are invalid by Part 2 rules."""
+        return _sum_sorted_in_range(self.part2_values, self.part2_prefix, start, end)
+
+def _sum_sorted_in_range(values: array, prefix: array, start: int, end: int) -> int:
+    """Sums the sorted values lying in [start, end] using their prefix sums."""
+    if start > end:
+        return 0
+    return prefix[bisect_right(values, end)] - prefix[bisect_left(values, start)]
+
+_periodic_indexes: dict[int, PeriodicIndex] = {}
+
+def get_periodic_index(max_digits: int = DEFAULT_INDEX_DIGITS, cache_dir: str | None = None) -> PeriodicIndex:
+    """Returns the periodic-number index, building it only on first use.
+
+    The index is kept in memory for the process and cached in cache_dir, so
+    later runs load it instead of generating it again. An unreadable cache
+    file is rebuilt and overwritten. When the cache cannot be written (e.g.
+    a read-only checkout), the index is only kept in memory.
+
+    Args:
+        max_digits (int): The digit bound of the index.
+        cache_dir (str | None): The directory holding the cached index files (default: INDEX_CACHE_DIR).
+
+    Returns:
+        PeriodicIndex: The index covering every value below 10^max_digits.
+    """
+    if max_digits not in _periodic_indexes:
+        cache_path = os.path.join(cache_dir or INDEX_CACHE_DIR, f'periodic_index_{max_digits}.bin')
+        index = None
+        if os.path.exists(cache_path):
+            try:
+                index = PeriodicIndex.load(cache_path)
+            except ValueError:
+                index = None
+        if index is None or index.max_digits != max_digits:
+            index = PeriodicIndex.build(max_digits)
+            try:
+                index.save(cache_path)
+            except OSError:
+                pass
+        _periodic_indexes[max_digits] = index
+    return _periodic_indexes[max_digits]
+
+def calculate_total_invalid(value_pairs: list[tuple[int, int]], is_invalid_func: Callable[[int], bool],
+                            use_index: bool = True) -> int:
     """Calculates the sum of all invalid values across all provided ranges using a specific validation function.
 
+    For the Part 1 and Part 2 rules, the sums are read from the periodic-number
+    index when it covers every range (building or loading it from the on-disk
+    cache on first use). Otherwise each value is checked in turn.
+
     Args:
         value_pairs (list[tuple[int, int]]): A list of tuples, each containing the start and end integer values.
         is_invalid_func (Callable[[int], bool]): The function to use for validating if a number is invalid.
+        use_index (bool): Whether the periodic-number index may be used.
 
     Returns:
         int: The sum of invalid values across all ranges.
     """
+    if use_index and is_invalid_func in (is_value_invalid_part1, is_value_invalid_part2):
+        index = get_periodic_index()
+        if index.covers(value_pairs):
+            range_sum = index.sum_part1 if is_invalid_func is is_value_invalid_part1 else index.sum_part2
+            return sum(range_sum(start, end) for start, end in value_pairs)
+
     total_invalid = 0
     for start, end in value_pairs:
         for value in range(start, end + 1):
@@ -112,17 +310,263 @@ def calculate_total_invalid(value_pairs: list[tuple[int, int]], is_invalid_func:
                 total_invalid += value
     return total_invalid
 
+def prime_factors(n: int) -> list[int]:
+    """Returns the distinct prime factors of a positive integer in increasing order.
+
+    Args:
+        n (int): The number to factor (e.g., 12).
+
+    Returns:
+        list[int]: The distinct prime factors (e.g., [2, 3]).
+    """
+    factors = []
+    factor = 2
+    while factor * factor <= n:
+        if n % factor == 0:
+            factors.append(factor)
+            while n % factor == 0:
+                n //= factor
+        factor += 1
+    if n > 1:
+        factors.append(n)
+    return factors
+
+def _periodic_base_interval(start: int, end: int, num_digits: int, period: int) -> tuple[int, int, int]:
+    """Returns (multiplier, low_base, high_base) of the periodic numbers in [start, end].
+
+    The interval is empty when low_base > high_base.
+    """
+    multiplier = (10 ** num_digits - 1) // (10 ** period - 1)
+    low_base = max(10 ** (period - 1), -(-start // multiplier))
+    high_base = min(10 ** period - 1, end // multiplier)
+    return multiplier, low_base, high_base
+
+def sum_periodic_in_range(start: int, end: int, num_digits: int, period: int) -> int:
+    """Sums the num_digits-digit numbers in [start, end] made of a period-digit block repeated.
+
+    Such a number is base * R with R = (10^num_digits - 1) / (10^period - 1)
+    (e.g., 1212 = 12 * 101), where base has exactly period digits. The matching
+    bases form one contiguous interval, so the sum is R times an arithmetic series.
+
+    Args:
+        start (int): The start of the range (inclusive).
+        end (int): The end of the range (inclusive).
+        num_digits (int): The total number of digits.
+        period (int): The length of the repeated block (must divide num_digits).
+
+    Returns:
+        int: The sum of the matching numbers.
+    """
+    multiplier, low_base, high_base = _periodic_base_interval(start, end, num_digits, period)
+    if low_base > high_base:
+        return 0
+    return multiplier * (low_base + high_base) * (high_base - low_base + 1) // 2
+
+def sum_invalid_part1_in_range(start: int, end: int) -> int:
+    """Sums the values of [start, end] that are invalid by Part 1 rules, without scanning the range.
+
+    Same result as summing is_value_invalid_part1 over the range: for each even
+    digit count n, the invalid values are exactly the numbers with period n / 2.
+
+    Args:
+        start (int): The start of the range (inclusive).
+        end (int): The end of the range (inclusive).
+
+    Returns:
+        int: The sum of the invalid values.
+    """
+    total = 0
+    for num_digits in range(2, len(str(end)) + 1, 2):
+        total += sum_periodic_in_range(start, end, num_digits, num_digits // 2)
+    return total
+
+def sum_invalid_part2_in_range(start: int, end: int) -> int:
+    """Sums the values of [start, end] that are invalid by Part 2 rules, without scanning the range.
+
+    Same result as summing is_value_invalid_part2 over the range. An n-digit
+    value repeats a block at least twice exactly when it has period n / q for
+    some prime q dividing n. A value with several such periods also has their
+    gcd as a period, which is n divided by the product of the primes. So
+    inclusion-exclusion over the sets of prime factors counts each value once.
+
+    Args:
+        start (int): The start of the range (inclusive).
+        end (int): The end of the range (inclusive).
+
+    Returns:
+        int: The sum of the invalid values.
+    """
+    total = 0
+    for num_digits in range(2, len(str(end)) + 1):
+        primes = prime_factors(num_digits)
+        for subset_size in range(1, len(primes) + 1):
+            sign = 1 if subset_size % 2 == 1 else -1
+            for subset in combinations(primes, subset_size):
+                period = num_digits // prod(subset)
+                total += sign * sum_periodic_in_range(start, end, num_digits, period)
+    return total
+
+def estimate_candidate_count(start: int, end: int) -> int:
+    """Estimates how many repeated-block numbers lie in [start, end].
+
+    Counts one candidate per (digit count, proper divisor period, base), so a
+    value with several periods is counted once per period. This is an upper
+    bound of the Part 2 invalid values, and it is used to weigh work units.
+
+    Args:
+        start (int): The start of the range (inclusive).
+        end (int): The end of the range (inclusive).
+
+    Returns:
+        int: The estimated number of candidates.
+    """
+    count = 0
+    for num_digits in range(2, len(str(end)) + 1):
+        for period in range(1, num_digits // 2 + 1):
+            if num_digits % period == 0:
+                _, low_base, high_base = _periodic_base_interval(start, end, num_digits, period)
+                count += max(0, high_base - low_base + 1)
+    return count
+
+def split_work_units(value_pairs: list[tuple[int, int]], num_units: int) -> list[list[tuple[int, int]]]:
+    """Splits ranges into work units holding about the same estimated number of candidates.
+
+    Ranges are weighed with estimate_candidate_count (plus one per range, so
+    many candidate-free ranges still spread out), once each. A range heavier
+    than the room left in the current unit is cut at the point found by
+    binary search. The estimate is additive over adjacent pieces, so the
+    weight of the rest of a cut range follows from the prefix that was cut off.
+
+    Args:
+        value_pairs (list[tuple[int, int]]): Disjoint (start, end) tuples, e.g. from merge_ranges.
+        num_units (int): The desired number of work units.
+
+    Returns:
+        list[list[tuple[int, int]]]: The work units, covering every value of the ranges exactly once.
+    """
+    weights = [estimate_candidate_count(start, end) + 1 for start, end in value_pairs]
+    target = max(1, -(-sum(weights) // max(1, num_units)))
+
+    units = []
+    current = []
+    current_weight = 0
+    for (start, end), weight in zip(value_pairs, weights):
+        while True:
+            if current_weight + weight <= target or start == end:
+                current.append((start, end))
+                current_weight += weight
+                break
+
+            # Find the longest prefix [start, split] that still fits in the current unit
+            room = target - current_weight
+            low, high = start, end - 1
+            split = None
+            split_weight = 0
+            while low <= high:
+                mid = (low + high) // 2
+                mid_weight = estimate_candidate_count(start, mid) + 1
+                if mid_weight <= room:
+                    split, split_weight = mid, mid_weight
+                    low = mid + 1
+                else:
+                    high = mid - 1
+            if split is None:
+                if current:
+                    units.append(current)
+                    current, current_weight = [], 0
+                    continue
+                split = start
+                split_weight = estimate_candidate_count(start, start) + 1
+
+            current.append((start, split))
+            units.append(current)
+            current, current_weight = [], 0
+            start = split + 1
+            weight -= split_weight - 1
+
+        if current_weight >= target:
+            units.append(current)
+            current, current_weight = [], 0
+
+    if current:
+        units.append(current)
+    return units
+
+def calculate_total_invalid_closed_form(value_pairs: list[tuple[int, int]],
+                                        range_sum_func: Callable[[int, int], int]) -> int:
+    """Calculates the sum of all invalid values across all ranges in closed form.
+
+    Same result as calculate_total_invalid, but the cost depends on the number
+    of digits rather than on the width of the ranges.
+
+    Args:
+        value_pairs (list[tuple[int, int]]): A list of tuples, each containing the start and end integer values.
+        range_sum_func (Callable[[int, int], int]): sum_invalid_part1_in_range or sum_invalid_part2_in_range.
+
+    Returns:
+        int: The sum of invalid values across all ranges.
+    """
+    return sum(range_sum_func(start, end) for start, end in value_pairs)
+
+def calculate_total_invalid_parallel(value_pairs: list[tuple[int, int]],
+                                     range_sum_func: Callable[[int, int], int],
+                                     workers: int | None = None) -> int:
+    """Calculates the sum of all invalid values, spreading balanced work units over a process pool.
+
+    The ranges are merged first, so every invalid value is counted exactly
+    once even when the given ranges overlap.
+
+    Args:
+        value_pairs (list[tuple[int, int]]): A list of tuples, each containing the start and end integer values.
+        range_sum_func (Callable[[int, int], int]): sum_invalid_part1_in_range or sum_invalid_part2_in_range.
+        workers (int | None): Number of worker processes (default: CPU count).
+
+    Returns:
+        int: The sum of invalid values across the merged ranges.
+    """
+    workers = workers or os.cpu_count() or 1
+    units = split_work_units(merge_ranges(value_pairs), workers * 4)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return sum(executor.map(calculate_total_invalid_closed_form, units, repeat(range_sum_func)))
+
+def solve_total_invalid(value_pairs: list[tuple[int, int]], range_sum_func: Callable[[int, int], int],
+                        workers: int | None = None, use_index: bool = True) -> int:
+    """Merges the ranges and sums their invalid values.
+
+    The closed form costs a few microseconds per range, which is less than
+    shipping the range to a worker, so the process pool is only used when
+    workers asks for more than one process. Serially, the sums are read from
+    the periodic-number index when it covers every range.
+
+    Args:
+        value_pairs (list[tuple[int, int]]): A list of tuples, each containing the start and end integer values.
+        range_sum_func (Callable[[int, int], int]): sum_invalid_part1_in_range or sum_invalid_part2_in_range.
+        workers (int | None): Number of worker processes to opt into (default: serial).
+        use_index (bool): Whether the periodic-number index may be used.
+
+    Returns:
+        int: The sum of invalid values across the merged ranges.
+    """
+    merged = merge_ranges(value_pairs)
+    if workers is not None and workers > 1:
+        return calculate_total_invalid_parallel(merged, range_sum_func, workers)
+    if use_index and range_sum_func in (sum_invalid_part1_in_range, sum_invalid_part2_in_range):
+        index = get_periodic_index()
+        if index.covers(merged):
+            range_sum_func = index.sum_part1 if range_sum_func is sum_invalid_part1_in_range else index.sum_part2
+    return calculate_total_invalid_closed_form(merged, range_sum_func)
+
 
 def part01(value_pairs: list[tuple[int, int]]):
     """Calculates and prints the solution for Part 1."""
     print("Advent of Code 2025 - Day 2 - Part 1")
-    total_invalid = calculate_total_invalid(value_pairs, is_value_invalid_part1)
+    total_invalid = solve_total_invalid(value_pairs, sum_invalid_part1_in_range)
     print(f"Total of invalid values: {total_invalid}")
 
 def part02(value_pairs: list[tuple[int, int]]):
     """Calculates and prints the solution for Part 2."""
     print("Advent of Code 2025 - Day 2 - Part 2")
-    total_invalid = calculate_total_invalid(value_pairs, is_value_invalid_part2)
+    total_invalid = solve_total_invalid(value_pairs, sum_invalid_part2_in_range)
     print(f"Total of invalid values: {total_invalid}")
 
 
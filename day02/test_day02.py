@@ -1,6 +1,8 @@
 import unittest
 import os
+import random
 import sys
+import tempfile
 
 # Add current directory to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -8,6 +10,18 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 import day02
 
 class TestDay02(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Keep the periodic-index cache out of the source tree
+        cls._cache_dir = tempfile.TemporaryDirectory()
+        cls._saved_cache_dir = day02.INDEX_CACHE_DIR
+        day02.INDEX_CACHE_DIR = cls._cache_dir.name
+
+    @classmethod
+    def tearDownClass(cls):
+        day02.INDEX_CACHE_DIR = cls._saved_cache_dir
+        cls._cache_dir.cleanup()
+
     def test_split_by_comma(self):
         self.assertEqual(day02.split_by_comma("1-5, 8-10"), ["1-5", "8-10"])
         self.assertEqual(day02.split_by_comma("1-5"), ["1-5"])
@@ -42,6 +56,108 @@ class TestDay02(unittest.TestCase):
         ranges = [(10, 13)]
         self.assertEqual(day02.calculate_total_invalid(ranges, day02.is_value_invalid_part1), 11)
 
+    def test_prime_factors(self):
+        self.assertEqual(day02.prime_factors(1), [])
+        self.assertEqual(day02.prime_factors(12), [2, 3])
+        self.assertEqual(day02.prime_factors(30), [2, 3, 5])
+        self.assertEqual(day02.prime_factors(7), [7])
+
+    def test_closed_form_matches_brute_force(self):
+        rng = random.Random(9)
+        ranges = [(1, 1000), (10, 13), (95, 115), (998, 1012), (123123, 123124), (1, 1)]
+        for _ in range(30):
+            start = rng.randint(1, 10 ** rng.randint(1, 7))
+            ranges.append((start, start + rng.randint(0, 20000)))
+        for start, end in ranges:
+            self.assertEqual(day02.sum_invalid_part1_in_range(start, end),
+                             day02.calculate_total_invalid([(start, end)], day02.is_value_invalid_part1, use_index=False))
+            self.assertEqual(day02.sum_invalid_part2_in_range(start, end),
+                             day02.calculate_total_invalid([(start, end)], day02.is_value_invalid_part2, use_index=False))
+
+    def test_closed_form_wide_ranges(self):
+        # Every 12-digit number made of six repeated digit pairs (e.g. 121212121212) is
+        # counted once, even though it also has periods 4 and 6
+        self.assertEqual(day02.sum_invalid_part2_in_range(121212121212, 121212121212), 121212121212)
+        # The 2-digit part 1 values are 11, 22, ..., 99
+        self.assertEqual(day02.calculate_total_invalid_closed_form([(1, 99)], day02.sum_invalid_part1_in_range), 495)
+        self.assertGreater(day02.sum_invalid_part2_in_range(1, 10 ** 30), 0)
+
+    def test_merge_ranges(self):
+        self.assertEqual(day02.merge_ranges([(10, 20), (1, 5), (6, 8), (15, 30), (40, 41)]),
+                         [(1, 8), (10, 30), (40, 41)])
+        self.assertEqual(day02.merge_ranges([]), [])
+
+    def test_split_work_units_covers_ranges_once(self):
+        ranges = day02.merge_ranges([(1, 10 ** 9), (11, 22), (5 * 10 ** 9, 6 * 10 ** 9)])
+        units = day02.split_work_units(ranges, 8)
+        self.assertGreaterEqual(len(units), 4)
+        pieces = sorted(piece for unit in units for piece in unit)
+        # The pieces are contiguous and cover exactly the merged ranges
+        self.assertEqual(day02.merge_ranges(pieces), ranges)
+        self.assertEqual(sum(end - start + 1 for start, end in pieces),
+                         sum(end - start + 1 for start, end in ranges))
+
+    def test_calculate_total_invalid_parallel(self):
+        ranges = [(1, 5000), (4000, 9000), (95, 115), (123000, 130000)]
+        merged = day02.merge_ranges(ranges)
+        for is_invalid, range_sum in ((day02.is_value_invalid_part1, day02.sum_invalid_part1_in_range),
+                                      (day02.is_value_invalid_part2, day02.sum_invalid_part2_in_range)):
+            self.assertEqual(day02.calculate_total_invalid_parallel(ranges, range_sum, workers=2),
+                             day02.calculate_total_invalid(merged, is_invalid, use_index=False))
+            self.assertEqual(day02.solve_total_invalid(ranges, range_sum),
+                             day02.solve_total_invalid(ranges, range_sum, workers=2))
+
+    def test_periodic_index_matches_brute_force(self):
+        index = day02.PeriodicIndex.build(6)
+        for start, end in [(1, 999999), (10, 13), (95, 115), (1000, 1212), (121212, 121212), (500, 400)]:
+            self.assertEqual(index.sum_part1(start, end),
+                             day02.calculate_total_invalid([(start, end)], day02.is_value_invalid_part1, use_index=False))
+            self.assertEqual(index.sum_part2(start, end),
+                             day02.calculate_total_invalid([(start, end)], day02.is_value_invalid_part2, use_index=False))
+        self.assertTrue(index.covers([(1, 999999)]))
+        self.assertFalse(index.covers([(1, 1000000)]))
+        with self.assertRaises(ValueError):
+            day02.PeriodicIndex.build(day02.MAX_INDEX_DIGITS + 1)
+
+    def test_periodic_index_disk_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            path = os.path.join(cache_dir, 'index.bin')
+            index = day02.PeriodicIndex.build(8)
+            index.save(path)
+            loaded = day02.PeriodicIndex.load(path)
+            self.assertEqual(loaded.max_digits, 8)
+            self.assertEqual(loaded.part2_values, index.part2_values)
+            self.assertEqual(loaded.sum_part2(1, 10 ** 8), day02.sum_invalid_part2_in_range(1, 10 ** 8))
+            self.assertEqual(os.listdir(cache_dir), ['index.bin'])
+            # A truncated file or a corrupt header is rejected
+            with open(path, 'r+b') as file:
+                file.truncate(os.path.getsize(path) - 8)
+            with self.assertRaises(ValueError):
+                day02.PeriodicIndex.load(path)
+            with open(path, 'wb') as file:
+                file.write(b'\xff' * 24)
+            with self.assertRaises(ValueError):
+                day02.PeriodicIndex.load(path)
+
+    def test_calculate_total_invalid_uses_index(self):
+        value_pairs = [(1, 10 ** 9), (95, 115)]
+        self.assertEqual(day02.calculate_total_invalid(value_pairs, day02.is_value_invalid_part2),
+                         day02.calculate_total_invalid_closed_form(value_pairs, day02.sum_invalid_part2_in_range))
+        self.assertEqual(day02.solve_total_invalid(value_pairs, day02.sum_invalid_part2_in_range),
+                         day02.solve_total_invalid(value_pairs, day02.sum_invalid_part2_in_range, use_index=False))
+
+    def test_periodic_index_unwritable_cache(self):
+        # A cache directory that cannot be created keeps the index in memory only
+        with tempfile.TemporaryDirectory() as temp_dir:
+            blocker = os.path.join(temp_dir, 'file')
+            open(blocker, 'w').close()
+            day02._periodic_indexes.pop(4, None)
+            try:
+                index = day02.get_periodic_index(4, cache_dir=os.path.join(blocker, 'cache'))
+                self.assertEqual(index.sum_part1(1, 9999), day02.sum_invalid_part1_in_range(1, 9999))
+            finally:
+                day02._periodic_indexes.pop(4, None)
+
     def test_part01_execution(self):
         input_lines = day02.utils.read_input_file(day02.INPUT_FILE_PATH)
         range_strs = day02.split_by_comma(input_lines[0])
@@ -1,7 +1,10 @@
 
 import os
 import sys
-from typing import List
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, repeat
+from typing import Dict, Iterable, List, Optional, Union
 
 # Add parent directory to path to import utils
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -10,6 +13,9 @@ import utils
 script_dir = os.path.dirname(os.path.abspath(__file__))
 INPUT_FILE_PATH = os.path.join(script_dir, 'PuzzleInput.txt')
 
+# Digit bytes from the largest to the smallest, in the order the greedy selection tries them
+DIGITS_DESCENDING = b'9876543210'
+
 def find_line_max_joltage(line: str, num_digits: int) -> int:
     """
     Finds the largest number that can be formed by picking a subsequence of
@@ -51,7 +57,107 @@ def find_line_max_joltage(line: str, num_digits: int) -> int:
 
     return int("".join(stack))
 
-def solve(lines: List[str], num_digits: int) -> int:
+def _select_max_digits(data: bytes, start: int, end: int, num_digits: int) -> int:
+    """
+    Finds the largest num_digits-digit subsequence of data[start:end].
+
+    Same result as find_line_max_joltage. Position i of the result is the
+    largest digit in the window that still leaves room for the remaining
+    digits. The earliest occurrence is taken, which is found with bytes.find,
+    trying the digits from 9 down. So each selected digit costs a few C-level
+    searches instead of a Python step per character.
+
+    Args:
+        data: A buffer holding the digits.
+        start: The first position of the line in data.
+        end: The position just past the line in data.
+        num_digits: The number of digits to select to form the number.
+    Returns:
+        The largest number as an integer, or 0 if the line has fewer than
+        `num_digits` or if `num_digits` is less than 1.
+    """
+    if num_digits < 1 or end - start < num_digits:
+        return 0
+
+    find = data.find
+    selected = bytearray()
+    low = start
+    for high in range(end - num_digits + 1, end + 1):
+        for digit in DIGITS_DESCENDING:
+            position = find(digit, low, high)
+            if position != -1:
+                break
+        selected.append(digit)
+        low = position + 1
+    return int(selected)
+
+def _select_max_digits_multi(row: bytes, num_digits_list: List[int]) -> List[int]:
+    """
+    Finds the largest subsequence of a row for several lengths in a single pass.
+
+    The best n-1 digit subsequence of the best n digit one is found by
+    removing its first digit that is smaller than the next one (or its last
+    digit when there is none). Popping the stack of find_line_max_joltage
+    without a removal budget performs exactly these removals in order. So one
+    pass over the row meets every length: after the r-th pop, the stack
+    followed by the unread digits is the best subsequence of length n - r.
+    Lengths that need more removals than there are pops are prefixes of the
+    final, non-increasing stack.
+
+    Args:
+        row: The digits of one line.
+        num_digits_list: The numbers of digits to select.
+    Returns:
+        The largest number for each entry of num_digits_list, in the same
+        order (0 where the row is too short or the entry is less than 1).
+    """
+    length = len(row)
+    results = [0] * len(num_digits_list)
+    wanted_removals: Dict[int, List[int]] = {}
+    for index, num_digits in enumerate(num_digits_list):
+        if 1 <= num_digits <= length:
+            wanted_removals.setdefault(length - num_digits, []).append(index)
+    if not wanted_removals:
+        return results
+
+    def record(removals: int, digits: bytes) -> None:
+        value = int(digits)
+        for index in wanted_removals[removals]:
+            results[index] = value
+
+    if 0 in wanted_removals:
+        record(0, row)
+    stack = bytearray()
+    removals = 0
+    for position, digit in enumerate(row):
+        while stack and stack[-1] < digit:
+            stack.pop()
+            removals += 1
+            if removals in wanted_removals:
+                record(removals, stack + row[position:])
+        stack.append(digit)
+
+    for needed in wanted_removals:
+        if needed > removals:
+            record(needed, stack[:length - needed])
+    return results
+
+def find_line_max_joltages(line: str, num_digits_list: List[int]) -> List[int]:
+    """
+    Finds the maximum joltage of one line for several numbers of digits.
+
+    The line is encoded once and every num_digits value is answered by the
+    same pass over it (see _select_max_digits_multi).
+
+    Args:
+        line: A string of digits.
+        num_digits_list: The numbers of digits to select (e.g. [2, 12]).
+    Returns:
+        The largest number for each entry of num_digits_list, in the same order.
+    """
+    return _select_max_digits_multi(line.strip().encode('ascii'), num_digits_list)
+
+def solve(lines: Iterable[str], num_digits: int) -> int:
     """
     Solves the puzzle by calculating the total joltage for all lines.
 
@@ -61,6 +167,7 @@ def solve(lines: List[str], num_digits: int) -> int:
 
     Args:
         lines: The input lines to process, each being a string of digits.
+               Any iterable works, so lines can be streamed from the file.
         num_digits: The number of digits to select to form the number.
     Returns:
         The total output joltage as an integer.
@@ -70,35 +177,206 @@ def solve(lines: List[str], num_digits: int) -> int:
         total_joltage += find_line_max_joltage(line, num_digits)
     return total_joltage
 
-def part01(lines: List[str]) -> None:
+class DigitMatrix:
     """
-    Calculates and prints the solution for Part One of the puzzle.
+    All battery lines packed into one bytes buffer, one row per line.
+
+    Rows are located through an offsets array, so lines of different lengths
+    are supported, but equal-length lines are the common case. Parsing happens
+    once, and the same matrix answers any number of num_digits queries.
+    """
+
+    def __init__(self, data: bytes, offsets: array):
+        """
+        Args:
+            data: The digits of every row, concatenated.
+            offsets: Row start positions in data, followed by len(data).
+        """
+        self.data = data
+        self.offsets = offsets
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> 'DigitMatrix':
+        """
+        Packs digit strings into a matrix (blank lines are skipped).
+
+        Args:
+            lines: The input lines, each being a string of digits.
+        Returns:
+            The packed matrix.
+        """
+        rows = [line.strip().encode('ascii') for line in lines]
+        return cls._from_rows([row for row in rows if row])
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'DigitMatrix':
+        """
+        Packs raw input bytes into a matrix without decoding them line by line.
+
+        Args:
+            data: The raw input, one digit line per line.
+        Returns:
+            The packed matrix.
+        """
+        return cls._from_rows(data.split())
+
+    @classmethod
+    def _from_rows(cls, rows: List[bytes]) -> 'DigitMatrix':
+        offsets = array('q', accumulate(map(len, rows), initial=0))
+        return cls(b''.join(rows), offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def row_max_joltage(self, row: int, num_digits: int) -> int:
+        """
+        Finds the largest num_digits-digit subsequence of a row (see _select_max_digits).
+
+        Args:
+            row: The row index.
+            num_digits: The number of digits to select to form the number.
+        Returns:
+            The largest number as an integer, or 0 if the row has fewer than
+            `num_digits` or if `num_digits` is less than 1.
+        """
+        return _select_max_digits(self.data, self.offsets[row], self.offsets[row + 1], num_digits)
+
+    def total_joltage(self, num_digits: int) -> int:
+        """
+        Sums the maximum joltage of every row.
+
+        Args:
+            num_digits: The number of digits to select to form each number.
+        Returns:
+            The total output joltage as an integer.
+        """
+        return sum(self.row_max_joltage(row, num_digits) for row in range(len(self)))
+
+def solve_batched(lines: Union[Iterable[str], DigitMatrix], num_digits: int) -> int:
+    """
+    Solves the puzzle like solve, but on a packed DigitMatrix.
+
+    Args:
+        lines: The input lines, or a DigitMatrix already built from them
+               (so several num_digits values share one parse).
+        num_digits: The number of digits to select to form the number.
+    Returns:
+        The total output joltage as an integer.
+    """
+    matrix = lines if isinstance(lines, DigitMatrix) else DigitMatrix.from_lines(lines)
+    return matrix.total_joltage(num_digits)
+
+def solve_multi(lines: Union[Iterable[str], DigitMatrix], num_digits_list: List[int]) -> List[int]:
+    """
+    Calculates the total joltage for several numbers of digits in one pass.
+
+    Each line is scanned once by _select_max_digits_multi, which answers every
+    num_digits value from the same pass, so sweeping many values does not
+    rescan the line once per value. Plain line iterables are streamed and
+    never held in memory.
+
+    Args:
+        lines: The input lines, or a DigitMatrix built from them.
+        num_digits_list: The numbers of digits to select (e.g. list(range(1, 21))).
+    Returns:
+        The total output joltage for each entry of num_digits_list, in the same order.
+    """
+    totals = [0] * len(num_digits_list)
+    if isinstance(lines, DigitMatrix):
+        data, offsets = lines.data, lines.offsets
+        line_results = (_select_max_digits_multi(data[offsets[row]:offsets[row + 1]], num_digits_list)
+                        for row in range(len(lines)))
+    else:
+        line_results = (find_line_max_joltages(line, num_digits_list) for line in lines)
+
+    for results in line_results:
+        for index, joltage in enumerate(results):
+            totals[index] += joltage
+    return totals
+
+def _solve_file_shard(file_path: str, start: int, end: int, num_digits: int) -> int:
+    """Solves the lines stored between two byte offsets of the input file."""
+    return DigitMatrix.from_bytes(utils.read_file_range(file_path, start, end)).total_joltage(num_digits)
+
+def _solve_block(block: List[str], num_digits: int) -> int:
+    """Solves one block of lines in a worker process."""
+    return solve_batched(block, num_digits)
+
+def solve_parallel(lines: Iterable[str], num_digits: int, workers: Optional[int] = None) -> int:
+    """
+    Solves the puzzle like solve, spreading blocks of lines over a process pool.
+
+    Lines are independent, so the totals of consecutive blocks are simply
+    added in block order, which gives exactly the result of solve.
 
     Args:
         lines: The input lines to process, each being a string of digits.
+        num_digits: The number of digits to select to form the number.
+        workers: Number of worker processes (default: CPU count).
+    Returns:
+        The total output joltage as an integer.
+    """
+    lines = list(lines)
+    workers = workers or os.cpu_count() or 1
+    block_size = max(1, -(-len(lines) // (workers * 4)))
+    blocks = [lines[i:i + block_size] for i in range(0, len(lines), block_size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return sum(executor.map(_solve_block, blocks, repeat(num_digits)))
+
+def solve_file_parallel(file_path: str, num_digits: int, workers: Optional[int] = None) -> int:
+    """
+    Solves the puzzle straight from a file, sharded by byte offset.
+
+    Workers receive only (start, end) offsets and read their own lines, so
+    no line lists are pickled between processes.
+
+    Args:
+        file_path: The path to the input file.
+        num_digits: The number of digits to select to form the number.
+        workers: Number of worker processes (default: CPU count).
+    Returns:
+        The total output joltage as an integer.
+    """
+    workers = workers or os.cpu_count() or 1
+    shards = utils.split_file_line_ranges(file_path, workers * 4)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        totals = executor.map(_solve_file_shard, repeat(file_path),
+                              [start for start, _ in shards], [end for _, end in shards],
+                              repeat(num_digits))
+        return sum(totals)
+
+def part01(lines: Union[Iterable[str], DigitMatrix]) -> None:
+    """
+    Calculates and prints the solution for Part One of the puzzle.
+
+    Args:
+        lines: The input lines to process, each being a string of digits
+               (or a DigitMatrix built from them).
     """
     print("Advent of Code 2025 - Day 3 - Part 1")
-    total_joltage = solve(lines, num_digits=2)
+    total_joltage = solve_batched(lines, num_digits=2)
     print(f"Total output joltage: {total_joltage}")
 
-def part02(lines: List[str]) -> None:
+def part02(lines: Union[Iterable[str], DigitMatrix]) -> None:
     """
     Calculates and prints the solution for Part Two of the puzzle.
 
     Args:
-        lines: The input lines to process, each being a string of digits.
+        lines: The input lines to process, each being a string of digits
+               (or a DigitMatrix built from them).
     """
     print("Advent of Code 2025 - Day 3 - Part 2")
-    total_joltage = solve(lines, num_digits=12)
+    total_joltage = solve_batched(lines, num_digits=12)
     print(f"Total output joltage: {total_joltage}")
 
 def main() -> None:
     """
     The main function to run the solution.
     """
-    lines = utils.read_input_file(INPUT_FILE_PATH)
-    part01(lines)
-    part02(lines)
+    # Parse the input once, both parts query the same matrix
+    matrix = DigitMatrix.from_bytes(utils.read_input_bytes(INPUT_FILE_PATH))
+    part01(matrix)
+    part02(matrix)
 
 if __name__ == "__main__":
     main()
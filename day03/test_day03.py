@@ -1,6 +1,8 @@
 import unittest
 import os
+import random
 import sys
+import tempfile
 
 # Add current directory to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -30,6 +32,56 @@ class TestDay03(unittest.TestCase):
         # 345 + 543 = 888
         self.assertEqual(day03.solve(lines, 3), 888)
 
+    def test_digit_matrix(self):
+        matrix = day03.DigitMatrix.from_lines(["12345", "", "54321", "1928", "12"])
+        self.assertEqual(len(matrix), 4)
+        self.assertEqual(matrix.row_max_joltage(0, 3), 345)
+        self.assertEqual(matrix.row_max_joltage(1, 3), 543)
+        self.assertEqual(matrix.row_max_joltage(2, 2), 98)
+        self.assertEqual(matrix.row_max_joltage(3, 3), 0)
+        self.assertEqual(matrix.row_max_joltage(0, 0), 0)
+        from_bytes = day03.DigitMatrix.from_bytes(b"12345\n54321\r\n1928\n12\n")
+        self.assertEqual(from_bytes.data, matrix.data)
+
+    def test_solve_batched_matches_solve(self):
+        rng = random.Random(3)
+        lines = ["".join(rng.choice("0123456789") for _ in range(rng.randint(1, 40))) for _ in range(200)]
+        matrix = day03.DigitMatrix.from_lines(lines)
+        for num_digits in (1, 2, 5, 12, 40):
+            self.assertEqual(day03.solve_batched(matrix, num_digits), day03.solve(lines, num_digits))
+            self.assertEqual(day03.solve_batched(lines, num_digits), day03.solve(lines, num_digits))
+
+    def test_find_line_max_joltages(self):
+        self.assertEqual(day03.find_line_max_joltages("1928", [1, 2, 4, 5]), [9, 98, 1928, 0])
+        # Repeated lengths, equal digits and the full line length
+        self.assertEqual(day03.find_line_max_joltages("3321", [0, 2, 2, 4, 3]), [0, 33, 33, 3321, 332])
+
+    def test_solve_multi_matches_solve(self):
+        rng = random.Random(4)
+        lines = ["".join(rng.choice("0123456789") for _ in range(30)) for _ in range(100)]
+        num_digits_list = list(range(1, 21))
+        expected = [day03.solve(lines, num_digits) for num_digits in num_digits_list]
+        self.assertEqual(day03.solve_multi(lines, num_digits_list), expected)
+        self.assertEqual(day03.solve_multi(iter(lines), num_digits_list), expected)
+        self.assertEqual(day03.solve_multi(day03.DigitMatrix.from_lines(lines), num_digits_list), expected)
+
+    def test_solve_parallel_matches_solve(self):
+        lines = day03.utils.read_input_file(day03.INPUT_FILE_PATH)
+        self.assertEqual(day03.solve_parallel(lines, 12, workers=2), day03.solve(lines, 12))
+        self.assertEqual(day03.solve_file_parallel(day03.INPUT_FILE_PATH, 2, workers=2), day03.solve(lines, 2))
+
+    def test_split_file_line_ranges(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'input.txt')
+            with open(path, 'wb') as file:
+                file.write(b"12345\n6789\n111111111\n22\n3")
+            ranges = day03.utils.split_file_line_ranges(path, 3)
+            self.assertEqual(ranges[0][0], 0)
+            self.assertEqual(ranges[-1][1], os.path.getsize(path))
+            chunks = [day03.utils.read_file_range(path, start, end) for start, end in ranges]
+            self.assertEqual(b"".join(chunks), b"12345\n6789\n111111111\n22\n3")
+            self.assertTrue(all(chunk.endswith(b"\n") for chunk in chunks[:-1]))
+
     def test_part01_execution(self):
         lines = day03.utils.read_input_file(day03.INPUT_FILE_PATH)
         try:
@@ -1,7 +1,8 @@
 
 import os
+import re
 import sys
-from typing import List, Tuple
+from typing import Iterator, List, Sequence, Tuple
 
 # Add parent directory to path to import utils
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -10,7 +11,10 @@ import utils
 script_dir = os.path.dirname(os.path.abspath(__file__))
 INPUT_FILE_PATH = os.path.join(script_dir, 'PuzzleInput.txt')
 
-def get_accessible_coordinates(grid: List[List[str]], roll_symbol: str, neighbors_max_num: int) -> List[Tuple[int, int]]:
+# Approximate number of cells RollGrid turns into one big integer at a time.
+BAND_CELLS = 1 << 20
+
+def get_accessible_coordinates(grid: Sequence[Sequence[str]], roll_symbol: str, neighbors_max_num: int) -> List[Tuple[int, int]]:
     """
     Identifies the coordinates of "accessible" paper rolls in the grid.
     
@@ -19,7 +23,8 @@ def get_accessible_coordinates(grid: List[List[str]], roll_symbol: str, neighbor
     or diagonal) that are also paper rolls.
 
     Args:
-        grid: The input grid (list of lists of characters).
+        grid: The input grid, indexed as grid[row][col] (list of lists of characters,
+              list of strings or a utils.MappedGrid).
         roll_symbol: The symbol representing a paper roll in the grid.
         neighbors_max_num: The maximum number of neighboring rolls allowed
                            for a roll to be considered accessible.
@@ -38,10 +43,17 @@ def get_accessible_coordinates(grid: List[List[str]], roll_symbol: str, neighbor
         (1, -1),  (1, 0),  (1, 1)
     ]
 
+    # Each row is read once, as a whole string, into a sliding window of the
+    # rows above, at and below the current one. Row views (utils.MappedGrid)
+    # are then decoded a row at a time instead of a cell at a time.
+    previous_text = None
+    current_text = ''.join(grid[0][:cols]) if rows else None
     for row in range(rows):
+        next_text = ''.join(grid[row + 1][:cols]) if row + 1 < rows else None
+        window = (previous_text, current_text, next_text)
         for col in range(cols):
             # Only check if it is a paper roll
-            if grid[row][col] != roll_symbol:
+            if current_text[col] != roll_symbol:
                 continue
             
             neighbor_rolls = 0
@@ -50,59 +62,382 @@ def get_accessible_coordinates(grid: List[List[str]], roll_symbol: str, neighbor
                 
                 # Boundary checks
                 if 0 <= neighbor_row < rows and 0 <= neighbor_col < cols:
-                    if grid[neighbor_row][neighbor_col] == roll_symbol:
+                    if window[delta_row + 1][neighbor_col] == roll_symbol:
                         neighbor_rolls += 1
             
             if neighbor_rolls < neighbors_max_num:
                 accessible_coords.append((row, col))
+        previous_text, current_text = current_text, next_text
                 
     return accessible_coords
 
-def part01(lines: List[str]) -> None:
+class RollGrid:
+    """
+    Compact roll grid with one byte per cell and one byte of neighbour count per cell.
+
+    Cells are stored row-major in a bytearray with a one-cell empty border, so
+    neighbours need no bounds checks. A 10k x 10k floor takes about 200 MB,
+    where a list of lists of one-character strings takes several gigabytes.
+    Counting and scanning work on bands of rows of about BAND_CELLS cells, so
+    their temporaries add only a few MB on top of that.
+    Cells are addressed by their flat index; use coordinates() to convert.
+    """
+
+    def __init__(self, rows: int, cols: int):
+        """
+        Creates an empty grid.
+
+        Args:
+            rows: The number of grid rows.
+            cols: The number of grid columns.
+        """
+        self.rows = rows
+        self.cols = cols
+        self.stride = cols + 2
+        self.cells = bytearray(self.stride * (rows + 2))
+        self.counts = bytearray(len(self.cells))
+        self.offsets = (-self.stride - 1, -self.stride, -self.stride + 1, -1,
+                        1, self.stride - 1, self.stride, self.stride + 1)
+
+    @classmethod
+    def from_grid(cls, grid: Sequence[Sequence[str]], roll_symbol: str) -> 'RollGrid':
+        """
+        Builds the compact grid and the neighbour counts of every roll.
+
+        Args:
+            grid: The input grid, indexed as grid[row][col] (list of lists of characters,
+                  list of strings or a utils.MappedGrid).
+            roll_symbol: The symbol representing a paper roll in the grid.
+
+        Returns:
+            The new grid.
+        """
+        rows = len(grid)
+        roll_grid = cls(rows, len(grid[0]) if rows else 0)
+        cols = roll_grid.cols
+        roll_byte = roll_symbol.encode('latin-1')[0]
+        to_cells = bytes(1 if byte == roll_byte else 0 for byte in range(256))
+
+        for row in range(rows):
+            text = ''.join(grid[row][:cols]).ljust(cols)
+            base = roll_grid.index(row, 0)
+            roll_grid.cells[base:base + cols] = text.encode('latin-1', 'replace').translate(to_cells)
+
+        # Byte-parallel count: viewed as one integer, each shifted copy of the
+        # cells adds a neighbour to every byte at once. A byte sums at most
+        # 8 ones, so no carry ever crosses into the next cell. Each band also
+        # reads the row above and below it, so bands need no stitching.
+        cells = roll_grid.cells
+        for start, end in roll_grid._bands():
+            low = max(0, start - roll_grid.stride - 1)
+            high = min(len(cells), end + roll_grid.stride + 1)
+            cells_value = int.from_bytes(cells[low:high], 'little')
+            total = 0
+            for offset in roll_grid.offsets:
+                if offset > 0:
+                    total += cells_value >> (8 * offset)
+                else:
+                    total += cells_value << (-8 * offset)
+            total = (total >> (8 * (start - low))) & ((1 << (8 * (end - start))) - 1)
+            roll_grid.counts[start:end] = total.to_bytes(end - start, 'little')
+        return roll_grid
+
+    def _bands(self) -> Iterator[Tuple[int, int]]:
+        """Yields (start, end) flat index ranges covering the grid in whole rows."""
+        size = len(self.cells)
+        band_size = self.stride * max(1, BAND_CELLS // self.stride)
+        for start in range(0, size, band_size):
+            yield start, min(size, start + band_size)
+
+    def index(self, row: int, col: int) -> int:
+        """Returns the flat index of (row, col)."""
+        return (row + 1) * self.stride + col + 1
+
+    def coordinates(self, cell: int) -> Tuple[int, int]:
+        """Returns the (row, col) of a flat index."""
+        row, col = divmod(cell, self.stride)
+        return row - 1, col - 1
+
+    def is_roll(self, row: int, col: int) -> bool:
+        """Tells whether (row, col) holds a roll."""
+        return self.cells[self.index(row, col)] == 1
+
+    def neighbor_count(self, row: int, col: int) -> int:
+        """Returns the number of rolls around (row, col) (only kept up to date for rolls)."""
+        return self.counts[self.index(row, col)]
+
+    def roll_cells(self) -> Iterator[int]:
+        """Yields the flat indices of every roll in row-major order."""
+        return _iter_flagged(self.cells)
+
+    def accessible_cells(self, neighbors_max_num: int) -> Iterator[int]:
+        """
+        Finds the rolls with fewer than neighbors_max_num neighbouring rolls.
+
+        Args:
+            neighbors_max_num: The maximum number of neighboring rolls allowed
+                               for a roll to be considered accessible.
+
+        Yields:
+            Their flat indices in row-major order.
+        """
+        # Each byte of cells * 16 + counts encodes both (counts never exceed 8),
+        # so one translate per band flags every accessible roll without a Python loop
+        to_flags = bytes(1 if key >= 16 and key - 16 < neighbors_max_num else 0 for key in range(256))
+        for start, end in self._bands():
+            cells_value = int.from_bytes(self.cells[start:end], 'little')
+            counts_value = int.from_bytes(self.counts[start:end], 'little')
+            keys = ((cells_value << 4) | counts_value).to_bytes(end - start, 'little')
+            for position in _iter_flagged(keys.translate(to_flags)):
+                yield start + position
+
+    def remove(self, removed: List[int], neighbors_max_num: int) -> List[int]:
+        """
+        Removes a batch of rolls and updates only the counts around them.
+
+        Counts drop by one at a time, so a remaining roll becomes accessible
+        exactly when its count reaches neighbors_max_num - 1.
+
+        Args:
+            removed: Flat indices of the rolls to remove.
+            neighbors_max_num: The accessibility threshold to watch.
+
+        Returns:
+            Flat indices of the remaining rolls that became accessible.
+        """
+        cells = self.cells
+        counts = self.counts
+        offsets = self.offsets
+        for cell in removed:
+            cells[cell] = 0
+
+        threshold = neighbors_max_num - 1
+        newly_accessible = []
+        for cell in removed:
+            for offset in offsets:
+                neighbor = cell + offset
+                if cells[neighbor]:
+                    counts[neighbor] -= 1
+                    if counts[neighbor] == threshold:
+                        newly_accessible.append(neighbor)
+        return newly_accessible
+
+def _iter_flagged(flags: bytes) -> Iterator[int]:
+    """Yields the positions of the one bytes in flags, in increasing order."""
+    position = flags.find(1)
+    while position != -1:
+        yield position
+        position = flags.find(1, position + 1)
+
+def peel_accessible_rolls(grid: Sequence[Sequence[str]], roll_symbol: str, neighbors_max_num: int) -> List[int]:
+    """
+    Repeatedly removes every accessible roll and reports how many go in each round.
+
+    Same rounds as calling get_accessible_coordinates and clearing the result
+    until nothing is accessible, but the neighbour counts are computed once.
+    Removing a roll only decrements its 8 neighbours. A roll whose count drops
+    below neighbors_max_num joins the next round's worklist (k-core peeling),
+    so the cost is proportional to the grid size plus the removals instead of
+    the grid size times the number of rounds. The state lives in a RollGrid,
+    which keeps memory at two bytes per cell.
+
+    Args:
+        grid: The input grid, indexed as grid[row][col] (list of lists of characters,
+              list of strings or a utils.MappedGrid).
+        roll_symbol: The symbol representing a paper roll in the grid.
+        neighbors_max_num: The maximum number of neighboring rolls allowed
+                           for a roll to be considered accessible.
+
+    Returns:
+        The number of rolls removed in each round, in order (empty if none).
+    """
+    roll_grid = RollGrid.from_grid(grid, roll_symbol)
+    layer = list(roll_grid.accessible_cells(neighbors_max_num))
+    removed_per_round = []
+    while layer:
+        removed_per_round.append(len(layer))
+        layer = roll_grid.remove(layer, neighbors_max_num)
+    return removed_per_round
+
+def pack_grid(grid: Sequence[Sequence[str]], roll_symbol: str) -> Tuple[int, int, int]:
+    """
+    Packs the roll cells of a grid into the bits of a single integer.
+
+    Cell (row, col) is bit row * (cols + 1) + col. The extra always-zero bit at
+    the end of each row keeps horizontal shifts from wrapping into the next row.
+
+    Args:
+        grid: The input grid, indexed as grid[row][col].
+        roll_symbol: The symbol representing a paper roll in the grid.
+
+    Returns:
+        A tuple (board, rows, cols).
+    """
+    rows = len(grid)
+    cols = len(grid[0]) if rows else 0
+    roll_byte = roll_symbol.encode('latin-1')[0]
+    to_bits = bytes(0x31 if byte == roll_byte else 0x30 for byte in range(256))
+
+    # The most significant bits come first in the binary literal, so rows and
+    # columns are written in reverse order
+    row_bits = []
+    for row in range(rows - 1, -1, -1):
+        text = ''.join(grid[row][:cols]).ljust(cols)
+        row_bits.append(b'0' + text.encode('latin-1', 'replace').translate(to_bits)[::-1])
+    board = int(b''.join(row_bits), 2) if rows and cols else 0
+    return board, rows, cols
+
+def _add_bit(counter: List[int], bits: int) -> None:
+    """Adds a one-bit board to a bit-sliced counter (counter[i] holds bit i of every cell)."""
+    for index in range(len(counter)):
+        counter[index], bits = counter[index] ^ bits, counter[index] & bits
+        if not bits:
+            return
+
+def get_accessible_mask(board: int, rows: int, cols: int, neighbors_max_num: int) -> int:
+    """
+    Computes the packed mask of accessible rolls with bit-parallel operations.
+
+    Same rolls as get_accessible_coordinates. The 8 neighbour boards are
+    shifted copies of the board, and they are summed into a 4-bit bit-sliced
+    counter. The comparison against neighbors_max_num is then done bit by bit
+    from the most significant counter bit. Every step is a whole-board integer
+    operation, so no cell is visited in Python.
+
+    Args:
+        board: The packed grid from pack_grid.
+        rows: The number of grid rows.
+        cols: The number of grid columns.
+        neighbors_max_num: The maximum number of neighboring rolls allowed
+                           for a roll to be considered accessible.
+
+    Returns:
+        The packed mask of accessible rolls, in the layout of pack_grid.
+    """
+    # No count is below 0, and every count (at most 8) is below anything larger
+    if neighbors_max_num <= 0:
+        return 0
+    if neighbors_max_num > 8:
+        return board
+
+    stride = cols + 1
+    full = (1 << (rows * stride)) - 1
+    # Rolls never sit in the guard column, so shifted bits landing there are dropped
+    columns = full // ((1 << stride) - 1) * ((1 << cols) - 1)
+
+    counter = [0, 0, 0, 0]
+    for shift in (1, stride - 1, stride, stride + 1):
+        _add_bit(counter, (board << shift) & columns & full)
+        _add_bit(counter, board >> shift & columns)
+
+    # count < neighbors_max_num, compared from the most significant bit down
+    less = 0
+    equal = full
+    for index in range(3, -1, -1):
+        if neighbors_max_num >> index & 1:
+            less |= equal & ~counter[index]
+            equal &= counter[index]
+        else:
+            equal &= ~counter[index]
+    return board & less
+
+def mask_to_coordinates(mask: int, cols: int) -> List[Tuple[int, int]]:
+    """
+    Converts a packed mask into (row, col) tuples in row-major order.
+
+    Args:
+        mask: A packed mask in the layout of pack_grid.
+        cols: The number of grid columns.
+
+    Returns:
+        The coordinates of the set bits.
+    """
+    stride = cols + 1
+    bits = bin(mask)[:1:-1]
+    return [divmod(match.start(), stride) for match in re.finditer('1', bits)]
+
+def get_accessible_coordinates_packed(grid: Sequence[Sequence[str]], roll_symbol: str,
+                                      neighbors_max_num: int) -> List[Tuple[int, int]]:
+    """
+    Identifies accessible paper rolls with the bit-packed kernel.
+
+    Same result as get_accessible_coordinates.
+
+    Args:
+        grid: The input grid, indexed as grid[row][col].
+        roll_symbol: The symbol representing a paper roll in the grid.
+        neighbors_max_num: The maximum number of neighboring rolls allowed
+                           for a roll to be considered accessible.
+
+    Returns:
+        A list of (row, col) tuples representing accessible paper rolls.
+    """
+    board, rows, cols = pack_grid(grid, roll_symbol)
+    return mask_to_coordinates(get_accessible_mask(board, rows, cols, neighbors_max_num), cols)
+
+def remove_accessible_rolls_packed(grid: Sequence[Sequence[str]], roll_symbol: str,
+                                   neighbors_max_num: int) -> List[int]:
+    """
+    Runs the removal rounds of part 2 on the packed board.
+
+    Same result as peel_accessible_rolls. Each round costs a few whole-board
+    integer operations.
+
+    Args:
+        grid: The input grid, indexed as grid[row][col].
+        roll_symbol: The symbol representing a paper roll in the grid.
+        neighbors_max_num: The maximum number of neighboring rolls allowed
+                           for a roll to be considered accessible.
+
+    Returns:
+        The number of rolls removed in each round, in order (empty if none).
+    """
+    board, rows, cols = pack_grid(grid, roll_symbol)
+    removed_per_round = []
+    while True:
+        accessible = get_accessible_mask(board, rows, cols, neighbors_max_num)
+        if not accessible:
+            return removed_per_round
+        removed_per_round.append(accessible.bit_count())
+        board ^= accessible
+
+def part01(lines: Sequence[str]) -> None:
     """
     Calculates and prints the solution for Part One of the puzzle.
     
     Args:
-        lines: The input grid lines.
+        lines: The input grid lines (list of strings or a utils.MappedGrid).
     """
     print("Advent of Code 2025 - Day 4 - Part 1")
     
-    grid = [list(line) for line in lines]
-    
-    accessible_coords = get_accessible_coordinates(grid, '@', 4)
+    # Read-only scan, so the rows are packed directly without copying them
+    accessible_coords = get_accessible_coordinates_packed(lines, '@', 4)
     print(f"Total number of accessible rolls: {len(accessible_coords)}")
 
-def part02(lines: List[str]) -> None:
+def part02(lines: Sequence[str], trace: bool = False) -> None:
     """
     Calculates and prints the solution for Part Two of the puzzle.
     
     Simulates the recursive removal of accessible paper rolls until none remain.
     
     Args:
-        lines: The input grid lines.
+        lines: The input grid lines (list of strings or a utils.MappedGrid).
+        trace: If True, also prints how many rolls are removed in each round.
     """
     print("Advent of Code 2025 - Day 4 - Part 2")
     
-    grid = [list(line) for line in lines]
-    total_removed = 0
-    
-    while True:
-        to_remove = get_accessible_coordinates(grid, '@', 4)
-        
-        if not to_remove:
-            break
-            
-        total_removed += len(to_remove)
-        
-        for r, c in to_remove:
-            grid[r][c] = '.'
+    # Worklist peeling: each round only revisits the neighbours of removed rolls
+    removed_per_round = peel_accessible_rolls(lines, '@', 4)
+    if trace:
+        for round_num, removed in enumerate(removed_per_round, start=1):
+            print(f"Round {round_num}: removed {removed} rolls")
             
-    print(f"Total number of removed rolls: {total_removed}")
+    print(f"Total number of removed rolls: {sum(removed_per_round)}")
 
 def main() -> None:
-    lines = utils.read_input_file(INPUT_FILE_PATH)
-    part01(lines)
-    part02(lines)
+    with utils.MappedGrid(INPUT_FILE_PATH) as grid:
+        part01(grid)
+        part02(grid)
 
 if __name__ == "__main__":
     main()
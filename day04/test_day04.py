@@ -1,5 +1,6 @@
 import unittest
 import os
+import random
 import sys
 
 # Add current directory to path
@@ -35,6 +36,64 @@ class TestDay04(unittest.TestCase):
         accessible_5 = day04.get_accessible_coordinates(grid, '@', 5)
         self.assertIn((1, 1), accessible_5)
 
+    def test_get_accessible_coordinates_mapped_grid(self):
+        # The memory-mapped grid must behave like the list of input lines
+        lines = day04.utils.read_input_file(day04.INPUT_FILE_PATH)
+        with day04.utils.MappedGrid(day04.INPUT_FILE_PATH) as grid:
+            self.assertEqual((len(grid), len(grid[0])), (len(lines), len(lines[0])))
+            self.assertEqual(day04.get_accessible_coordinates(grid, '@', 4),
+                             day04.get_accessible_coordinates(lines, '@', 4))
+            # Closing must not fail while a row view is still alive, and the view stays readable
+            row_view = grid.row_bytes(0)
+        self.assertEqual(bytes(row_view).decode('latin-1'), lines[0].rstrip())
+
+    def test_peel_accessible_rolls_matches_rounds(self):
+        lines = day04.utils.read_input_file(day04.INPUT_FILE_PATH)
+        # Reference: the round-based simulation on a mutable copy of the grid
+        grid = [list(line) for line in lines]
+        expected = []
+        while True:
+            to_remove = day04.get_accessible_coordinates(grid, '@', 4)
+            if not to_remove:
+                break
+            expected.append(len(to_remove))
+            for r, c in to_remove:
+                grid[r][c] = '.'
+        self.assertEqual(day04.peel_accessible_rolls(lines, '@', 4), expected)
+        self.assertEqual(day04.peel_accessible_rolls(["...", "..."], '@', 4), [])
+        self.assertEqual(day04.peel_accessible_rolls([], '@', 4), [])
+
+    def test_roll_grid(self):
+        roll_grid = day04.RollGrid.from_grid([".@.", "@@@", ".@."], '@')
+        self.assertTrue(roll_grid.is_roll(1, 1))
+        self.assertFalse(roll_grid.is_roll(0, 0))
+        self.assertEqual(roll_grid.neighbor_count(1, 1), 4)
+        self.assertEqual(roll_grid.neighbor_count(0, 1), 3)
+        accessible = list(roll_grid.accessible_cells(4))
+        self.assertEqual([roll_grid.coordinates(cell) for cell in accessible], [(0, 1), (1, 0), (1, 2), (2, 1)])
+        # Removing the four arms leaves the centre with no neighbours
+        newly_accessible = roll_grid.remove(accessible, 4)
+        self.assertEqual([roll_grid.coordinates(cell) for cell in newly_accessible], [(1, 1)])
+        self.assertEqual(roll_grid.neighbor_count(1, 1), 0)
+
+    def test_pack_grid(self):
+        board, rows, cols = day04.pack_grid(["@.", ".@", "@@"], '@')
+        self.assertEqual((rows, cols), (3, 2))
+        # Bits 0, 4, 6 and 7 with a stride of 3
+        self.assertEqual(board, 0b11010001)
+        self.assertEqual(day04.mask_to_coordinates(board, cols), [(0, 0), (1, 1), (2, 0), (2, 1)])
+
+    def test_packed_kernel_matches_loops(self):
+        rng = random.Random(6)
+        for _ in range(100):
+            rows, cols = rng.randint(1, 9), rng.randint(1, 9)
+            grid = ["".join(rng.choice("@@.") for _ in range(cols)) for _ in range(rows)]
+            for neighbors_max_num in range(-2, 10):
+                self.assertEqual(day04.get_accessible_coordinates_packed(grid, '@', neighbors_max_num),
+                                 day04.get_accessible_coordinates(grid, '@', neighbors_max_num))
+                self.assertEqual(day04.remove_accessible_rolls_packed(grid, '@', neighbors_max_num),
+                                 day04.peel_accessible_rolls(grid, '@', neighbors_max_num))
+
     def test_part01_execution(self):
         lines = day04.utils.read_input_file(day04.INPUT_FILE_PATH)
         try:
@@ -1,8 +1,14 @@
 
 import bisect
+import heapq
+import mmap
 import os
 import sys
-from typing import List, Tuple
+import tempfile
+from array import array
+from itertools import islice, repeat
+from operator import le
+from typing import Iterable, Iterator, List, Sequence, Tuple, Union
 
 # Add parent directory to path to import utils
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -13,6 +19,13 @@ Range = Tuple[int, int]
 script_dir = os.path.dirname(os.path.abspath(__file__))
 INPUT_FILE_PATH = os.path.join(script_dir, 'PuzzleInput.txt')
 
+# Number of ranges sorted in memory per on-disk run, and ranges read per block when merging runs
+DEFAULT_RUN_SIZE = 1_000_000
+RUN_READ_BLOCK = 65_536
+
+# Smallest signed 64-bit value, used as the end of a virtual range before the first one
+MIN_INT64 = -(1 << 63)
+
 def parse_range(range_str: str) -> Range:
     """Parses a single range string (e.g., "5-10") to extract start and end integers.
 
@@ -30,7 +43,7 @@ def parse_range(range_str: str) -> Range:
     
     return start, end
 
-def parse_inventory_data(lines: List[str]) -> Tuple[List[Range], List[int]]:
+def parse_inventory_data(lines: Iterable[str]) -> Tuple[List[Range], List[int]]:
     """
     Splits the input lines into fresh ingredient ID ranges and available ingredient IDs.
     
@@ -44,7 +57,7 @@ def parse_inventory_data(lines: List[str]) -> Tuple[List[Range], List[int]]:
     ...
 
     Args:
-        lines: The input lines.
+        lines: The input lines (a list or a lazy line iterator).
     Returns:
         A tuple containing:
             - A list of tuples (start, end) representing fresh ingredient ID ranges.
@@ -96,16 +109,193 @@ def merge_ranges(ranges: List[Range]) -> List[Range]:
     # Convert inner lists back to tuples for consistency
     return [tuple(r) for r in merged]
 
-def count_fresh_ingredients(merged_ranges: List[Range], ingredient_ids: List[int]) -> int:
+class IntervalIndex:
+    """
+    Reusable lookup structure over merged ranges, built once and queried many times.
+
+    The ranges are kept as parallel start/end arrays of signed 64-bit integers,
+    or as plain lists when some bound does not fit in 64 bits.
+    """
+
+    def __init__(self, merged_ranges: List[Range]):
+        """
+        Args:
+            merged_ranges: A list of non-overlapping, sorted inclusive ranges
+                           (the output of merge_ranges).
+        """
+        starts = [start for start, _ in merged_ranges]
+        ends = [end for _, end in merged_ranges]
+        try:
+            self.starts = array('q', starts)
+            self.ends = array('q', ends)
+            # ends shifted by one, so bisect_right positions index it directly
+            self._ends_by_position = array('q', [MIN_INT64]) + self.ends
+        except OverflowError:
+            self.starts = starts
+            self.ends = ends
+            self._ends_by_position = [float('-inf')] + ends
+
+    @classmethod
+    def from_ranges(cls, ranges: List[Range]) -> 'IntervalIndex':
+        """Merges arbitrary ranges and indexes the result."""
+        return cls(merge_ranges(ranges))
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def contains(self, ingredient_id: int) -> bool:
+        """Tells whether an ID lies in one of the ranges."""
+        return ingredient_id <= self._ends_by_position[bisect.bisect_right(self.starts, ingredient_id)]
+
+    def count_contained(self, ingredient_ids: Sequence[int]) -> int:
+        """
+        Counts how many IDs of a batch lie in the ranges.
+
+        Already sorted batches are answered with one linear sweep. Other batches
+        get one bisect per ID, but all of them run through map, so no
+        per-ID Python code is executed.
+
+        Args:
+            ingredient_ids: The IDs to check.
+        Returns:
+            The number of contained IDs.
+        """
+        if all(map(le, ingredient_ids, islice(ingredient_ids, 1, None))):
+            return self._count_sorted(ingredient_ids)
+
+        positions = map(bisect.bisect_right, repeat(self.starts), ingredient_ids)
+        return sum(map(le, ingredient_ids, map(self._ends_by_position.__getitem__, positions)))
+
+    def _count_sorted(self, ingredient_ids: Sequence[int]) -> int:
+        """Counts the contained IDs of a sorted batch with a merge-sweep over the ranges."""
+        starts = self.starts
+        ends = self.ends
+        num_ranges = len(starts)
+        position = 0
+        count = 0
+        for ingredient_id in ingredient_ids:
+            while position < num_ranges and ends[position] < ingredient_id:
+                position += 1
+            if position == num_ranges:
+                break
+            if starts[position] <= ingredient_id:
+                count += 1
+        return count
+
+    def total_coverage(self) -> int:
+        """Returns the number of IDs covered by the ranges."""
+        return sum(self.ends) - sum(self.starts) + len(self.starts)
+
+class IntervalSet:
+    """
+    Mutable set of disjoint inclusive ranges, kept sorted and coalesced.
+
+    Adding a range merges it with every range it overlaps or touches. Removing
+    a range splits the ranges it cuts through. The covered ID count is updated
+    on every change, so it never needs a full rescan. Ranges are located with
+    bisect (O(log n)). The sorted start/end lists are then patched in place with
+    a single slice assignment instead of re-sorting everything.
+    """
+
+    def __init__(self, ranges: Iterable[Range] = ()):
+        """
+        Args:
+            ranges: Initial (start, end) tuples, in any order and possibly overlapping.
+        """
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        self._covered = 0
+        for start, end in ranges:
+            self.add(start, end)
+
+    def add(self, start: int, end: int) -> None:
+        """
+        Inserts the inclusive range [start, end], coalescing it with its neighbours.
+
+        Raises:
+            ValueError: If start is greater than end.
+        """
+        if start > end:
+            raise ValueError(f"Invalid range: {start}-{end}")
+
+        # Ranges [first, last) overlap or touch the new one
+        first = bisect.bisect_left(self._ends, start - 1)
+        last = bisect.bisect_right(self._starts, end + 1)
+        if first < last:
+            start = min(start, self._starts[first])
+            end = max(end, self._ends[last - 1])
+            self._covered -= self._span(first, last)
+
+        self._starts[first:last] = [start]
+        self._ends[first:last] = [end]
+        self._covered += end - start + 1
+
+    def remove(self, start: int, end: int) -> None:
+        """
+        Deletes every ID of [start, end], splitting the ranges that stick out of it.
+
+        Raises:
+            ValueError: If start is greater than end.
+        """
+        if start > end:
+            raise ValueError(f"Invalid range: {start}-{end}")
+
+        # Ranges [first, last) overlap the removed one
+        first = bisect.bisect_left(self._ends, start)
+        last = bisect.bisect_right(self._starts, end)
+        if first >= last:
+            return
+
+        kept_starts = []
+        kept_ends = []
+        if self._starts[first] < start:
+            kept_starts.append(self._starts[first])
+            kept_ends.append(start - 1)
+        if self._ends[last - 1] > end:
+            kept_starts.append(end + 1)
+            kept_ends.append(self._ends[last - 1])
+
+        self._covered -= self._span(first, last)
+        self._covered += sum(kept_ends) - sum(kept_starts) + len(kept_starts)
+        self._starts[first:last] = kept_starts
+        self._ends[first:last] = kept_ends
+
+    def _span(self, first: int, last: int) -> int:
+        """Returns the number of IDs covered by the ranges [first, last)."""
+        return sum(self._ends[first:last]) - sum(self._starts[first:last]) + (last - first)
+
+    def __contains__(self, ingredient_id: int) -> bool:
+        position = bisect.bisect_right(self._starts, ingredient_id) - 1
+        return position >= 0 and ingredient_id <= self._ends[position]
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __iter__(self) -> Iterator[Range]:
+        return zip(self._starts, self._ends)
+
+    def total_coverage(self) -> int:
+        """Returns the number of IDs covered by the ranges (kept up to date on every change)."""
+        return self._covered
+
+    def to_index(self) -> IntervalIndex:
+        """Snapshots the current ranges into an IntervalIndex for batch queries."""
+        return IntervalIndex(list(self))
+
+def count_fresh_ingredients(merged_ranges: Union[List[Range], IntervalIndex], ingredient_ids: List[int]) -> int:
     """
     Counts how many ingredient IDs fall within the merged ranges efficiently.
 
     Args:
-        merged_ranges: A list of non-overlapping, sorted inclusive ranges.
+        merged_ranges: A list of non-overlapping, sorted inclusive ranges,
+                       or an IntervalIndex built from them.
         ingredient_ids: A list of ingredient IDs to check.
     Returns:
         The count of fresh ingredients.
     """
+    if isinstance(merged_ranges, IntervalIndex):
+        return merged_ranges.count_contained(ingredient_ids)
+
     fresh_count = 0
     start_points = [r[0] for r in merged_ranges]
 
@@ -119,23 +309,194 @@ def count_fresh_ingredients(merged_ranges: List[Range], ingredient_ids: List[int
                 
     return fresh_count
 
-def part01(merged_ranges: List[Range], available_ingredient_ids: List[int]) -> None:
+def iter_fresh_ranges(file_path: str) -> Iterator[Range]:
+    """Lazily yields the ranges of the first input section, stopping at the blank line."""
+    for line in utils.iter_input_lines(file_path):
+        if not line:
+            return
+        yield parse_range(line)
+
+def iter_available_ids(file_path: str) -> Iterator[int]:
+    """Lazily yields the ingredient IDs of the second input section."""
+    lines = utils.iter_input_lines(file_path)
+    for line in lines:
+        if not line:
+            break
+    for line in lines:
+        yield int(line)
+
+def write_sorted_runs(ranges: Iterable[Range], run_dir: str, run_size: int = DEFAULT_RUN_SIZE) -> List[str]:
+    """
+    Splits a stream of ranges into sorted runs stored on disk.
+
+    At most run_size ranges are held in memory. Each run is written as a flat
+    array of signed 64-bit (start, end) pairs.
+
+    Args:
+        ranges: The (start, end) tuples, in any order.
+        run_dir: The directory the run files are written to.
+        run_size: The number of ranges per run.
+    Returns:
+        The paths of the run files, in creation order.
+    """
+    run_paths = []
+    ranges = iter(ranges)
+    while True:
+        run = sorted(islice(ranges, run_size))
+        if not run:
+            return run_paths
+        path = os.path.join(run_dir, f'run_{len(run_paths):05d}.bin')
+        with open(path, 'wb') as file:
+            array('q', (bound for pair in run for bound in pair)).tofile(file)
+        run_paths.append(path)
+
+def _iter_run(path: str) -> Iterator[Range]:
+    """Yields the (start, end) pairs of a run file, reading it block by block."""
+    with open(path, 'rb') as file:
+        while True:
+            block = array('q')
+            block.frombytes(file.read(RUN_READ_BLOCK * 2 * block.itemsize))
+            if not block:
+                return
+            yield from zip(block[0::2], block[1::2])
+
+def merge_runs(run_paths: List[str], output_path: str) -> int:
+    """
+    K-way merges sorted runs with heapq.merge, coalescing ranges on the fly.
+
+    Only one block per run and one output block are in memory at a time.
+
+    Args:
+        run_paths: The sorted run files from write_sorted_runs.
+        output_path: The binary file receiving the merged (start, end) pairs.
+    Returns:
+        The number of merged ranges written.
+    """
+    merged_count = 0
+    with open(output_path, 'wb') as file:
+        buffer = array('q')
+        current = None
+        for start, end in heapq.merge(*(_iter_run(path) for path in run_paths)):
+            if current is not None and start <= current[1] + 1:
+                current[1] = max(current[1], end)
+                continue
+            if current is not None:
+                buffer.extend(current)
+                merged_count += 1
+                if len(buffer) >= 2 * RUN_READ_BLOCK:
+                    buffer.tofile(file)
+                    buffer = array('q')
+            current = [start, end]
+        if current is not None:
+            buffer.extend(current)
+            merged_count += 1
+        buffer.tofile(file)
+    return merged_count
+
+def external_merge_ranges(ranges: Iterable[Range], output_path: str, run_size: int = DEFAULT_RUN_SIZE) -> int:
+    """
+    Merges ranges that may not fit in memory into a compact binary file.
+
+    Same ranges as merge_ranges, written as signed 64-bit (start, end) pairs.
+    Peak memory is bounded by run_size and the merge blocks, whatever the
+    input size. The temporary runs live next to output_path and are deleted.
+
+    Args:
+        ranges: The (start, end) tuples, in any order (e.g. iter_fresh_ranges).
+        output_path: The binary file receiving the merged ranges.
+        run_size: The number of ranges sorted in memory at once.
+    Returns:
+        The number of merged ranges written.
+    """
+    run_parent = os.path.dirname(os.path.abspath(output_path))
+    with tempfile.TemporaryDirectory(dir=run_parent) as run_dir:
+        return merge_runs(write_sorted_runs(ranges, run_dir, run_size), output_path)
+
+class MergedRangeFile:
+    """
+    Read-only view of a merged range file written by external_merge_ranges.
+
+    The file is memory-mapped and viewed as signed 64-bit integers. Lookups
+    bisect the mapping directly, so only the touched pages are loaded.
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, 'rb')
+        if os.fstat(self._file.fileno()).st_size:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._map).cast('q')
+        else:
+            self._map = None
+            self._view = memoryview(array('q'))
+        self.starts = self._view[0::2]
+        self.ends = self._view[1::2]
+
+    def __enter__(self) -> 'MergedRangeFile':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def close(self) -> None:
+        """Releases the views, the mapping and the file."""
+        self.starts.release()
+        self.ends.release()
+        self._view.release()
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def contains(self, ingredient_id: int) -> bool:
+        """Tells whether an ID lies in one of the merged ranges."""
+        position = bisect.bisect_right(self.starts, ingredient_id) - 1
+        return position >= 0 and ingredient_id <= self.ends[position]
+
+    def count_contained(self, ingredient_ids: Iterable[int]) -> int:
+        """Counts the contained IDs of a (possibly unbounded) stream, one at a time."""
+        return sum(map(self.contains, ingredient_ids))
+
+    def total_coverage(self) -> int:
+        """Returns the number of IDs covered by the merged ranges."""
+        return sum(self.ends) - sum(self.starts) + len(self)
+
+def count_fresh_ingredients_external(file_path: str, merged_path: str,
+                                     run_size: int = DEFAULT_RUN_SIZE) -> Tuple[int, int]:
+    """
+    Solves both parts from an input file without loading its sections into lists.
+
+    Args:
+        file_path: The puzzle input file.
+        merged_path: Where the merged range file is written.
+        run_size: The number of ranges sorted in memory at once.
+    Returns:
+        A tuple (fresh ingredient count, total fresh ingredient IDs).
+    """
+    external_merge_ranges(iter_fresh_ranges(file_path), merged_path, run_size)
+    with MergedRangeFile(merged_path) as merged:
+        return merged.count_contained(iter_available_ids(file_path)), merged.total_coverage()
+
+def part01(merged_ranges: Union[List[Range], IntervalIndex], available_ingredient_ids: List[int]) -> None:
     """
     Calculates and prints the number of fresh ingredients.
     """
     print("Advent of Code 2025 - Day 5 - Part 1")
     
-    fresh_count = count_fresh_ingredients(merged_ranges, available_ingredient_ids)
+    index = merged_ranges if isinstance(merged_ranges, IntervalIndex) else IntervalIndex(merged_ranges)
+    fresh_count = count_fresh_ingredients(index, available_ingredient_ids)
 
     print(f"Total fresh ingredients: {fresh_count}")
 
-def part02(merged_ranges: List[Range]) -> None:
+def part02(merged_ranges: Union[List[Range], IntervalIndex]) -> None:
     """
     Calculates and prints the total number of fresh ingredient IDs.
     """
     print("Advent of Code 2025 - Day 5 - Part 2")
     
-    total_fresh_ids = sum(end - start + 1 for start, end in merged_ranges)
+    index = merged_ranges if isinstance(merged_ranges, IntervalIndex) else IntervalIndex(merged_ranges)
+    total_fresh_ids = index.total_coverage()
 
     print(f"Total fresh ingredient IDs: {total_fresh_ids}")
 
@@ -143,11 +504,10 @@ def main() -> None:
     """
     Main function to run the solution.
     """
-    lines = utils.read_input_file(INPUT_FILE_PATH)
-    fresh_ranges, available_ids = parse_inventory_data(lines)
-    merged_ranges = merge_ranges(fresh_ranges)
-    part01(merged_ranges, available_ids)
-    part02(merged_ranges)
+    fresh_ranges, available_ids = parse_inventory_data(utils.iter_input_lines(INPUT_FILE_PATH))
+    index = IntervalIndex.from_ranges(fresh_ranges)
+    part01(index, available_ids)
+    part02(index)
 
 if __name__ == "__main__":
     main()
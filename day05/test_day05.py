@@ -1,6 +1,8 @@
 import unittest
 import os
+import random
 import sys
+import tempfile
 
 # Add current directory to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -26,6 +28,103 @@ class TestDay05(unittest.TestCase):
         ids = [5, 15]
         self.assertEqual(day05.count_fresh_ingredients(ranges, ids), 1)
 
+    def test_interval_index(self):
+        index = day05.IntervalIndex.from_ranges([(10, 14), (3, 5), (16, 20), (12, 18)])
+        self.assertEqual(len(index), 2)
+        self.assertEqual(list(index.starts), [3, 10])
+        self.assertEqual(list(index.ends), [5, 20])
+        self.assertTrue(index.contains(3))
+        self.assertTrue(index.contains(20))
+        self.assertFalse(index.contains(2))
+        self.assertFalse(index.contains(9))
+        self.assertFalse(index.contains(21))
+        self.assertEqual(index.total_coverage(), 14)
+        self.assertEqual(day05.IntervalIndex([]).count_contained([1, 2]), 0)
+
+    def test_interval_index_beyond_64_bits(self):
+        index = day05.IntervalIndex.from_ranges([(1, 2**64), (2**70, 2**70 + 5)])
+        self.assertEqual(index.count_contained([5]), 1)
+        self.assertEqual(index.count_contained([2**70 + 6, 2**70 + 1, 0]), 1)
+        self.assertTrue(index.contains(2**64))
+        self.assertFalse(index.contains(2**64 + 1))
+        self.assertEqual(index.total_coverage(), 2**64 + 6)
+
+    def test_interval_index_batches_match_bisect(self):
+        rng = random.Random(5)
+        ranges = [(start, start + rng.randint(0, 50)) for start in (rng.randint(0, 5000) for _ in range(100))]
+        merged = day05.merge_ranges(ranges)
+        index = day05.IntervalIndex(merged)
+        ids = [rng.randint(-10, 5100) for _ in range(2000)]
+        expected = day05.count_fresh_ingredients(merged, ids)
+        self.assertEqual(index.count_contained(ids), expected)
+        self.assertEqual(index.count_contained(sorted(ids)), expected)
+        self.assertEqual(index.total_coverage(), sum(end - start + 1 for start, end in merged))
+
+    def test_interval_set(self):
+        fresh = day05.IntervalSet([(10, 14), (3, 5)])
+        fresh.add(15, 20)  # Adjacent, coalesced with 10-14
+        self.assertEqual(list(fresh), [(3, 5), (10, 20)])
+        fresh.remove(12, 13)
+        self.assertEqual(list(fresh), [(3, 5), (10, 11), (14, 20)])
+        self.assertEqual(fresh.total_coverage(), 3 + 2 + 7)
+        self.assertIn(14, fresh)
+        self.assertNotIn(12, fresh)
+        fresh.add(1, 30)
+        self.assertEqual(list(fresh), [(1, 30)])
+        with self.assertRaises(ValueError):
+            fresh.add(5, 4)
+
+    def test_interval_set_matches_merge(self):
+        rng = random.Random(7)
+        fresh = day05.IntervalSet()
+        covered = set()
+        for _ in range(500):
+            start = rng.randint(0, 300)
+            end = start + rng.randint(0, 30)
+            if rng.random() < 0.6:
+                fresh.add(start, end)
+                covered.update(range(start, end + 1))
+            else:
+                fresh.remove(start, end)
+                covered.difference_update(range(start, end + 1))
+            self.assertEqual(fresh.total_coverage(), len(covered))
+        self.assertEqual(list(fresh), day05.merge_ranges([(value, value) for value in covered]))
+        self.assertEqual(fresh.to_index().count_contained(list(range(-5, 340))), len(covered))
+
+    def test_external_merge_ranges(self):
+        rng = random.Random(8)
+        ranges = [(start, start + rng.randint(0, 40)) for start in (rng.randint(0, 10000) for _ in range(1000))]
+        expected = day05.merge_ranges(ranges)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            merged_path = os.path.join(temp_dir, 'merged.bin')
+            # Small runs force a real k-way merge
+            self.assertEqual(day05.external_merge_ranges(ranges, merged_path, run_size=37), len(expected))
+            with day05.MergedRangeFile(merged_path) as merged:
+                self.assertEqual(list(zip(merged.starts, merged.ends)), expected)
+                ids = [rng.randint(-5, 10100) for _ in range(500)]
+                self.assertEqual(merged.count_contained(iter(ids)), day05.count_fresh_ingredients(expected, ids))
+                self.assertEqual(merged.total_coverage(), day05.IntervalIndex(expected).total_coverage())
+
+            empty_path = os.path.join(temp_dir, 'empty.bin')
+            self.assertEqual(day05.external_merge_ranges([], empty_path), 0)
+            with day05.MergedRangeFile(empty_path) as merged:
+                self.assertEqual(merged.count_contained([1, 2]), 0)
+
+    def test_count_fresh_ingredients_external(self):
+        lines = day05.utils.read_input_file(day05.INPUT_FILE_PATH)
+        fresh_ranges, available_ids = day05.parse_inventory_data(lines)
+        index = day05.IntervalIndex.from_ranges(fresh_ranges)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            result = day05.count_fresh_ingredients_external(day05.INPUT_FILE_PATH,
+                                                            os.path.join(temp_dir, 'merged.bin'), run_size=50)
+        self.assertEqual(result, (index.count_contained(available_ids), index.total_coverage()))
+
+    def test_parse_inventory_data_streaming(self):
+        # Parsing a lazy line iterator must match parsing the materialised list
+        lines = day05.utils.read_input_file(day05.INPUT_FILE_PATH)
+        streamed = day05.utils.iter_input_lines(day05.INPUT_FILE_PATH)
+        self.assertEqual(day05.parse_inventory_data(streamed), day05.parse_inventory_data(lines))
+
     def test_part01_execution(self):
         lines = day05.utils.read_input_file(day05.INPUT_FILE_PATH)
         fresh_ranges, available_ids = day05.parse_inventory_data(lines)
@@ -1,7 +1,13 @@
 
+import bisect
+import gc
 import os
+import re
 import sys
-from typing import List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, repeat
+from operator import attrgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeAlias, Union
 import math
 
 # Add parent directory to path to import utils
@@ -11,27 +17,71 @@ import utils
 script_dir = os.path.dirname(os.path.abspath(__file__))
 INPUT_FILE_PATH = os.path.join(script_dir, 'PuzzleInput.txt')
 
-def build_occupancy_map(lines: List[str]) -> List[bool]:
+# (operator, row-wise operands for part 1, column-wise operands for part 2)
+DecodedBlock: TypeAlias = Tuple[str, Tuple[int, ...], Tuple[int, ...]]
+
+# Total estimate_block_cost (about 0.5 s of big-integer multiplication) from which
+# evaluate_blocks_parallel actually hands the blocks to its process pool
+PARALLEL_MIN_COST = 500_000_000
+# Total operand bit length from which '*' blocks are multiplied with a product tree
+PRODUCT_TREE_MIN_BITS = 4096
+
+# Input size from which main evaluates the worksheet in streaming mode
+STREAMING_MIN_BYTES = 64 << 20
+
+# Maps a raw byte to b'1' when it occupies its column (anything but a space) and b'0' otherwise
+OCCUPANCY_BITS = bytes(0x30 if byte == 0x20 else 0x31 for byte in range(256))
+# Every byte except the digits and the line break, deleted from the transposed columns
+NON_DIGIT_BYTES = bytes(byte for byte in range(256) if not (0x30 <= byte <= 0x39 or byte == 0x0A))
+
+def row_occupancy_mask(row: bytes) -> int:
+    """
+    Converts a raw row into an integer whose bit x is set when column x is not a space.
+
+    Args:
+        row: The raw bytes of one row (without its line break).
+
+    Returns:
+        The occupancy bitmask of the row.
+    """
+    if not row:
+        return 0
+    return int(row.translate(OCCUPANCY_BITS)[::-1], 2)
+
+def mask_to_spans(mask: int) -> List[Tuple[int, int]]:
+    """
+    Finds the runs of set bits of an occupancy bitmask.
+
+    Args:
+        mask: An occupancy bitmask (bit x for column x).
+
+    Returns:
+        A list of (start_index, end_index) tuples, as returned by define_spans.
+    """
+    bits = bin(mask)[:1:-1] if mask else ''
+    return [match.span() for match in re.finditer('1+', bits)]
+
+def build_occupancy_map(lines: Sequence[str]) -> List[bool]:
     """
     Builds a map indicating which character columns are occupied.
 
+    The rows are scanned one at a time (row-major) and ORed into a single
+    bitmask, instead of probing every row for each column.
+
     Args:
-        lines: A list of strings (rows).
+        lines: The rows (a list of strings or a utils.MappedGrid).
 
     Returns:
         A list of booleans, where each boolean indicates if the corresponding
         character column has at least one non-space character.
     """
     width = len(lines[0])
-    occupancy_map = [False] * width
+    mask = 0
+    for line in lines:
+        mask |= row_occupancy_mask(str(line)[:width].encode('latin-1', 'replace'))
 
-    for x in range(width):
-        for line in lines:
-            if x < len(line) and line[x] != ' ':
-                occupancy_map[x] = True
-                break
-
-    return occupancy_map
+    bits = bin(mask)[:1:-1] if mask else ''
+    return [bit == '1' for bit in bits.ljust(width, '0')]
 
 def define_spans(occupancy_map: List[bool]) -> List[Tuple[int, int]]:
     """
@@ -61,12 +111,12 @@ def define_spans(occupancy_map: List[bool]) -> List[Tuple[int, int]]:
 
     return spans
 
-def slice_data_into_columns(lines: List[str], spans: List[Tuple[int, int]]) -> List[List[str]]:
+def slice_data_into_columns(lines: Sequence[str], spans: List[Tuple[int, int]]) -> List[List[str]]:
     """
     Slices the input lines into columns based on defined spans.
 
     Args:
-        lines: A list of strings (rows).
+        lines: The rows (a list of strings or a utils.MappedGrid).
         spans: A list of tuples defining (start_index, end_index) for each column.
 
     Returns:
@@ -78,12 +128,12 @@ def slice_data_into_columns(lines: List[str], spans: List[Tuple[int, int]]) -> L
         columns.append(col)
     return columns
 
-def extract_problem_blocks(lines: List[str]) -> Tuple[List[List[str]], List[Tuple[int, int]]]:
+def extract_problem_blocks(lines: Sequence[str]) -> Tuple[List[List[str]], List[Tuple[int, int]]]:
     """
     Extracts problem blocks from the grid based on empty column separators.
 
     Args:
-        lines: A list of strings (rows).
+        lines: The rows (a list of strings or a utils.MappedGrid).
 
     Returns:
         A tuple containing:
@@ -102,6 +152,110 @@ def extract_problem_blocks(lines: List[str]) -> Tuple[List[List[str]], List[Tupl
 
     return problem_blocks, spans
 
+class BlockView:
+    """
+    Zero-copy view of one problem block over the raw input buffer.
+
+    Only the (start, end) offsets of each row and the column span are stored.
+    Indexing returns the block row as a string padded to the block width, so
+    a view can be passed to solve_part1_block and solve_part2_block like a
+    list of strings. The rows are decoded together on first access and kept,
+    so the per-character loops of the solvers index plain strings.
+    """
+
+    __slots__ = ('data', 'rows', 'span', '_text_rows')
+
+    def __init__(self, data: memoryview, rows: List[Tuple[int, int]], span: Tuple[int, int]):
+        """
+        Args:
+            data: The raw input buffer.
+            rows: The (start, end) offsets of every grid row in data.
+            span: The (start, end) column span of the block.
+        """
+        self.data = data
+        self.rows = rows
+        self.span = span
+        self._text_rows: Optional[List[str]] = None
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def row_bytes(self, row: int) -> memoryview:
+        """Returns the bytes of a block row without copying (short rows are not padded)."""
+        row_start, row_end = self.rows[row]
+        start, end = self.span
+        return self.data[min(row_start + start, row_end):min(row_start + end, row_end)]
+
+    def text_rows(self) -> List[str]:
+        """Returns every block row as a string padded to the block width, decoding them only once."""
+        if self._text_rows is None:
+            start, end = self.span
+            data = self.data
+            self._text_rows = [data[row_start + start:min(row_start + end, row_end)].tobytes().decode('latin-1').ljust(end - start)
+                               for row_start, row_end in self.rows]
+        return self._text_rows
+
+    def __getitem__(self, row: int) -> str:
+        return self.text_rows()[row]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.text_rows())
+
+def split_rows(data: Union[bytes, memoryview]) -> List[Tuple[int, int]]:
+    """
+    Locates the rows of a raw buffer.
+
+    Args:
+        data: The raw input.
+
+    Returns:
+        The (start, end) offsets of each row, excluding the line break (and a
+        trailing carriage return). A final empty line is not a row.
+    """
+    # re scans any buffer in place, so a memoryview is not copied
+    rows = []
+    start = 0
+    size = len(data)
+    line_ends = [match.start() for match in re.finditer(rb'\n', data)]
+    if not line_ends or line_ends[-1] != size - 1:
+        line_ends.append(size)
+    for end in line_ends:
+        if start >= size:
+            break
+        next_start = end + 1
+        if end > start and data[end - 1] == 0x0D:
+            end -= 1
+        rows.append((start, end))
+        start = next_start
+    return rows
+
+def extract_problem_blocks_bytes(data: Union[bytes, memoryview]) -> Tuple[List[BlockView], List[Tuple[int, int]]]:
+    """
+    Extracts the problem blocks straight from the raw input bytes.
+
+    Same blocks as extract_problem_blocks on the padded lines. The rows are
+    scanned once in row-major order: each row is turned into an occupancy
+    bitmask with bytes.translate, and the masks are ORed together. The runs of
+    set bits are the block spans, and the blocks are returned as views
+    without copying any row.
+
+    Args:
+        data: The raw input.
+
+    Returns:
+        A tuple containing:
+        - A list of BlockView, one per problem block.
+        - A list of tuples defining the (start, end) span of each block.
+    """
+    view = memoryview(data)
+    rows = split_rows(data)
+    mask = 0
+    for start, end in rows:
+        mask |= row_occupancy_mask(view[start:end].tobytes())
+
+    spans = mask_to_spans(mask)
+    return [BlockView(view, rows, span) for span in spans], spans
+
 def solve_part1_block(problem_block: List[str]) -> int:
     """
     Calculates the value of a problem block for Part 1 (horizontal numbers).
@@ -163,27 +317,373 @@ def solve_part2_block(problem_block: List[str]) -> int:
     else:
         raise ValueError(f"Unknown operation: '{operator}'")
 
-def part01(problem_blocks: List[List[str]]) -> None:
+def transpose_digit_columns(number_rows: List[bytes]) -> List[bytes]:
+    """
+    Reads equally long rows column by column, keeping only the digits.
+
+    The rows are interleaved column-major with a line break closing each
+    column (one strided slice assignment per row), then one translate
+    deletes every non-digit. Splitting on the line
+    breaks gives each column's digits from top to bottom, so int() turns them
+    into the part 2 number without a per-character Python loop.
+
+    Args:
+        number_rows: The raw number rows, all padded to the same width.
+
+    Returns:
+        The digits of each column, left to right (empty for a blank column).
+    """
+    if not number_rows:
+        return []
+    width = len(number_rows[0])
+    stride = len(number_rows) + 1
+    interleaved = bytearray(b'\n' * (width * stride))
+    for offset, row in enumerate(number_rows):
+        interleaved[offset::stride] = row
+    return interleaved.translate(None, NON_DIGIT_BYTES).split(b'\n')[:width]
+
+def decode_problem_block(problem_block: Sequence[str]) -> DecodedBlock:
+    """
+    Decodes a block once into its operator and the operands of both readings.
+
+    The rows are read as part 1 numbers. Each column's digits, with blanks
+    skipped, form a part 2 number (right to left, like solve_part2_block).
+
+    Args:
+        problem_block: A list of strings representing the problem block (or a BlockView).
+
+    Returns:
+        A tuple (operator, row operands, column operands).
+    """
+    rows = [row.encode('latin-1') for row in problem_block]
+    operator = rows[-1].strip().decode('latin-1')
+    number_rows = rows[:-1]
+
+    row_operands = tuple(int(row) for row in number_rows if not row.isspace() and row)
+    column_operands = tuple(int(digits) for digits in reversed(transpose_digit_columns(number_rows)) if digits)
+    return operator, row_operands, column_operands
+
+def _decode_worksheet_blocks(problem_blocks: List[BlockView]) -> List[DecodedBlock]:
+    """
+    Decodes all the views of one worksheet with a single pass over its rows.
+
+    The work is done on flat per-row and per-column lists, so a block costs
+    only its result tuples:
+    - a row whose tokens match the blocks one to one is parsed with a single
+      split, and zip regroups the rows' values into each block's row operands;
+    - the number rows are transposed once with transpose_digit_columns, all
+      the column numbers are parsed right to left into one list, and each
+      block takes a slice of it, located with a prefix count of the
+      non-blank columns.
+    """
+    data = problem_blocks[0].data
+    width = max(end - start for start, end in problem_blocks[0].rows)
+    rows = [data[start:end].tobytes().ljust(width) for start, end in problem_blocks[0].rows]
+    operator_row = rows[-1]
+    number_rows = rows[:-1]
+    spans = [block.span for block in problem_blocks]
+    num_blocks = len(spans)
+
+    operators = operator_row.split()
+    if len(operators) == num_blocks:
+        operators = [operator.decode('latin-1') for operator in operators]
+    else:
+        operators = [operator_row[start:end].strip().decode('latin-1') for start, end in spans]
+
+    # Row operands, one value per block and None where the block row is blank
+    operand_rows = []
+    all_rows_full = True
+    for row in number_rows:
+        tokens = row.split()
+        if len(tokens) == num_blocks:
+            operand_rows.append(list(map(int, tokens)))
+        else:
+            all_rows_full = False
+            operand_rows.append([None if row[start:end].isspace() else int(row[start:end]) for start, end in spans])
+    if not number_rows:
+        row_operands = [()] * num_blocks
+    elif all_rows_full:
+        row_operands = list(zip(*operand_rows))
+    else:
+        row_operands = [tuple(value for value in values if value is not None) for values in zip(*operand_rows)]
+
+    # Column numbers from right to left; columns [start, end) are entries
+    # [total - non_blank[end], total - non_blank[start]) of the reversed list
+    columns = transpose_digit_columns(number_rows) or [b''] * width
+    column_values = tuple(map(int, filter(None, reversed(columns))))
+    non_blank = list(accumulate(map(bool, columns), initial=0))
+    total = non_blank[-1]
+    lows = [total - non_blank[end] for _, end in spans]
+    highs = [total - non_blank[start] for start, _ in spans]
+    column_operands = list(map(column_values.__getitem__, map(slice, lows, highs)))
+
+    return list(zip(operators, row_operands, column_operands))
+
+def decode_problem_blocks(problem_blocks: Sequence[Sequence[str]]) -> List[DecodedBlock]:
+    """
+    Decodes every block, so both parts share one decoding.
+
+    Views of one worksheet (from extract_problem_blocks_bytes) are decoded
+    together, other blocks one at a time with decode_problem_block.
+    """
+    if problem_blocks and all(map(isinstance, problem_blocks, repeat(BlockView))):
+        # Views of one worksheet share the same row list
+        if len(set(map(id, map(attrgetter('rows'), problem_blocks)))) == 1:
+            # The result is millions of small acyclic tuples: pausing the cyclic
+            # collector while they are built skips collections that free nothing
+            collecting = gc.isenabled()
+            gc.disable()
+            try:
+                return _decode_worksheet_blocks(list(problem_blocks))
+            finally:
+                if collecting:
+                    gc.enable()
+    return [decode_problem_block(block) for block in problem_blocks]
+
+def _apply_operator(operator: str, numbers: List[int]) -> int:
+    """Combines the numbers of a block with its operator, like the block solvers."""
+    if operator == '+':
+        return sum(numbers)
+    elif operator == '*':
+        return math.prod(numbers)
+    else:
+        raise ValueError(f"Unknown operation: '{operator}'")
+
+def product_tree(numbers: List[int]) -> int:
+    """
+    Multiplies numbers pairwise in a balanced tree.
+
+    Same result as math.prod, but the partial products stay about the same
+    size, so large operands use the fast big-integer multiplication instead
+    of many big-by-small steps.
+
+    Args:
+        numbers: The factors.
+
+    Returns:
+        Their product (1 for an empty list).
+    """
+    if not numbers:
+        return 1
+    level = list(numbers)
+    while len(level) > 1:
+        paired = [level[i] * level[i + 1] for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0]
+
+def evaluate_operands(operator: str, operands: List[int]) -> int:
+    """Combines block operands, using a product tree when the '*' product gets large.
+
+    The tree only pays off once the partial products reach the sizes where
+    the big-integer multiplication beats schoolbook steps, so it is chosen by
+    the total operand size (about the product's size), not by operand count.
+    """
+    if (operator == '*' and len(operands) > 2
+            and sum(map(int.bit_length, operands)) >= PRODUCT_TREE_MIN_BITS):
+        return product_tree(operands)
+    return _apply_operator(operator, operands)
+
+def estimate_block_cost(operator: str, operands: List[int]) -> int:
+    """
+    Estimates the big-integer multiplication time of a block, in about nanoseconds.
+
+    Only the work a worker process can take over is counted: multiplying
+    the digits grows as digits ** 1.585 (Karatsuba). Sums and the
+    per-operand interpreter overhead cost about the same as shipping the
+    operands to a worker, so they count as zero.
+    """
+    if operator != '*' or len(operands) < 2:
+        return 0
+    digits = sum(map(int.bit_length, operands)) * 30103 // 100000 + 1
+    return int(digits ** 1.585) // 10
+
+def split_contiguous(costs: List[int], num_bins: int) -> List[Tuple[int, int]]:
+    """
+    Cuts a sequence of costs into contiguous ranges of about equal total cost.
+
+    Args:
+        costs: The estimated cost of each block.
+        num_bins: The desired number of ranges.
+
+    Returns:
+        Consecutive non-empty (start, end) index ranges covering every block.
+    """
+    prefix = list(accumulate(costs, initial=0))
+    total = prefix[-1]
+    num_bins = max(1, min(num_bins, len(costs)))
+    cuts = [0]
+    for bin_index in range(1, num_bins):
+        cut = bisect.bisect_left(prefix, total * bin_index // num_bins)
+        if cuts[-1] < cut < len(costs):
+            cuts.append(cut)
+    cuts.append(len(costs))
+    return [(start, end) for start, end in zip(cuts, cuts[1:]) if start < end]
+
+def _evaluate_range(work: List[Tuple[str, List[int]]]) -> int:
+    """Evaluates a contiguous range of blocks in a worker process and returns their total."""
+    return sum(evaluate_operands(operator, operands) for operator, operands in work)
+
+def evaluate_blocks_parallel(decoded_blocks: List[DecodedBlock], part: int, workers: Optional[int] = None,
+                             min_cost: int = PARALLEL_MIN_COST) -> int:
+    """
+    Evaluates decoded blocks on a process pool and returns the grand total.
+
+    The costs are estimated once. Below min_cost in total the pool could not
+    win back its start-up and pickling, so the blocks are evaluated in this
+    process. Otherwise they are cut into contiguous ranges of about equal
+    cost, a few per worker, and each worker returns the total of its range.
+
+    Args:
+        decoded_blocks: The output of decode_problem_blocks.
+        part: 1 for the row operands, 2 for the column operands.
+        workers: Number of worker processes (default: CPU count).
+        min_cost: The total estimate_block_cost from which the pool is used.
+
+    Returns:
+        The grand total of the chosen part.
+    """
+    operand_index = 1 if part == 1 else 2
+    work = [(block[0], block[operand_index]) for block in decoded_blocks]
+    costs = [estimate_block_cost(operator, operands) for operator, operands in work]
+    workers = workers or os.cpu_count() or 1
+    if workers < 2 or sum(costs) < min_cost:
+        return _evaluate_range(work)
+
+    ranges = split_contiguous(costs, workers * 4)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return sum(executor.map(_evaluate_range, [work[start:end] for start, end in ranges]))
+
+def iter_worksheet_results(chunks: Iterable[bytes]) -> Iterator[Tuple[int, int]]:
+    """
+    Evaluates a worksheet from a stream of line-aligned byte chunks.
+
+    Same values as solve_part1_block and solve_part2_block on the extracted
+    blocks, but only per-column state is kept:
+    - the occupancy bitmask of the rows seen so far,
+    - the vertical number of each column, built digit by digit (part 2),
+    - the sum, product and count of the horizontal numbers, keyed by the
+      column they start at (part 1). Every number lies inside one block, so
+      it can be assigned to its block once the spans are known.
+    When the operator row arrives, the spans are final: each block's results
+    are emitted and the state is reset for a possible next worksheet.
+
+    Args:
+        chunks: Byte chunks made of whole lines (e.g. utils.iter_input_line_chunks).
+
+    Yields:
+        A (part 1 value, part 2 value) tuple per block, from left to right.
+    """
+    mask = 0
+    column_values: Dict[int, int] = {}
+    number_sums: Dict[int, int] = {}
+    number_products: Dict[int, int] = {}
+
+    for chunk in chunks:
+        for row in chunk.split(b'\n'):
+            row = row.rstrip(b'\r')
+            if not row:
+                continue
+            mask |= row_occupancy_mask(row)
+
+            if b'+' not in row and b'*' not in row:
+                for match in re.finditer(rb'[^ ]+', row):
+                    token = match.group()
+                    start = match.start()
+                    value = int(token)
+                    number_sums[start] = number_sums.get(start, 0) + value
+                    number_products[start] = number_products.get(start, 1) * value
+                    for offset, byte in enumerate(token):
+                        if 0x30 <= byte <= 0x39:
+                            column = start + offset
+                            column_values[column] = column_values.get(column, 0) * 10 + byte - 0x30
+                continue
+
+            # Operator row: every block is complete
+            spans = mask_to_spans(mask)
+            span_starts = [start for start, _ in spans]
+            operators = ['?'] * len(spans)
+            for match in re.finditer(rb'[^ ]+', row):
+                operators[bisect.bisect_right(span_starts, match.start()) - 1] = match.group().decode('latin-1')
+
+            # Number starts sorted once, so each span takes its share with two bisects
+            number_starts = sorted(number_sums)
+            for (start, end), operator in zip(spans, operators):
+                starts = number_starts[bisect.bisect_left(number_starts, start):bisect.bisect_left(number_starts, end)]
+                if operator == '*':
+                    part1_value = math.prod(number_products[column] for column in starts)
+                else:
+                    part1_value = _apply_operator(operator, [number_sums[column] for column in starts])
+                numbers = [column_values[column] for column in range(end - 1, start - 1, -1) if column in column_values]
+                yield part1_value, _apply_operator(operator, numbers)
+
+            mask = 0
+            column_values.clear()
+            number_sums.clear()
+            number_products.clear()
+
+def evaluate_worksheet_streaming(file_path: str, chunk_size: int = utils.DEFAULT_CHUNK_SIZE) -> Tuple[int, int]:
+    """
+    Computes both grand totals while reading the file in bands of whole lines.
+
+    Memory is proportional to the number of columns, not to the grid size.
+
+    Args:
+        file_path: The path to the worksheet.
+        chunk_size: The approximate number of bytes read per band.
+
+    Returns:
+        A tuple (part 1 grand total, part 2 grand total).
+    """
+    part1_total = 0
+    part2_total = 0
+    for part1_value, part2_value in iter_worksheet_results(utils.iter_input_line_chunks(file_path, chunk_size)):
+        part1_total += part1_value
+        part2_total += part2_value
+    return part1_total, part2_total
+
+def part01(problem_blocks: List[List[str]], decoded_blocks: Optional[List[DecodedBlock]] = None,
+           workers: Optional[int] = None) -> None:
     """
     Solves Part 1: Uses extracted problem blocks to find boundaries, then solves rows.
+
+    When decoded_blocks (from decode_problem_blocks) is given, its row operands are used,
+    on a process pool of that many workers when workers > 1 (opt-in).
     """
     print("Advent of Code 2025 - Day 6 - Part 1")
     
     grand_total = 0
-    for block in problem_blocks:
-        grand_total += solve_part1_block(block)
+    if decoded_blocks is not None and workers is not None and workers > 1:
+        grand_total = evaluate_blocks_parallel(decoded_blocks, part=1, workers=workers)
+    elif decoded_blocks is not None:
+        for operator, row_operands, _ in decoded_blocks:
+            grand_total += evaluate_operands(operator, row_operands)
+    else:
+        for block in problem_blocks:
+            grand_total += solve_part1_block(block)
     
     print(f"Grand Total: {grand_total}")
 
-def part02(problem_blocks: List[List[str]]) -> None:
+def part02(problem_blocks: List[List[str]], decoded_blocks: Optional[List[DecodedBlock]] = None,
+           workers: Optional[int] = None) -> None:
     """
     Solves Part 2: Vertical numbers in columns.
+
+    When decoded_blocks (from decode_problem_blocks) is given, its column operands are used,
+    on a process pool of that many workers when workers > 1 (opt-in).
     """
     print("Advent of Code 2025 - Day 6 - Part 2")
 
     grand_total = 0
-    for block in problem_blocks:
-        grand_total += solve_part2_block(block)
+    if decoded_blocks is not None and workers is not None and workers > 1:
+        grand_total = evaluate_blocks_parallel(decoded_blocks, part=2, workers=workers)
+    elif decoded_blocks is not None:
+        for operator, _, column_operands in decoded_blocks:
+            grand_total += evaluate_operands(operator, column_operands)
+    else:
+        for block in problem_blocks:
+            grand_total += solve_part2_block(block)
 
     print(f"Grand Total: {grand_total}")
 
@@ -191,19 +691,30 @@ def main() -> None:
     """
     Main function to run the solution.
     """
-    lines = utils.read_grid_padded(INPUT_FILE_PATH)
-    if not lines:
+    # Large worksheets are evaluated band by band instead of being loaded whole
+    if os.path.getsize(INPUT_FILE_PATH) >= STREAMING_MIN_BYTES:
+        part1_total, part2_total = evaluate_worksheet_streaming(INPUT_FILE_PATH)
+        print("Advent of Code 2025 - Day 6 - Part 1")
+        print(f"Grand Total: {part1_total}")
+        print("Advent of Code 2025 - Day 6 - Part 2")
+        print(f"Grand Total: {part2_total}")
+        return
+
+    input_data = utils.read_input_bytes(INPUT_FILE_PATH)
+    if not input_data.strip(b'\r\n'):
         print("No input data.")
         return
 
-    problem_blocks, _ = extract_problem_blocks(lines)
+    problem_blocks, _ = extract_problem_blocks_bytes(input_data)
     
     if not problem_blocks:
         print(f"Grand Total: 0 ")
         return
 
-    part01(problem_blocks)
-    part02(problem_blocks)
+    # Decode the blocks once, both parts read their operands from it
+    decoded_blocks = decode_problem_blocks(problem_blocks)
+    part01(problem_blocks, decoded_blocks)
+    part02(problem_blocks, decoded_blocks)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
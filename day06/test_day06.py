@@ -1,5 +1,7 @@
 import unittest
+import math
 import os
+import random
 import sys
 
 # Add current directory to path
@@ -46,6 +48,102 @@ class TestDay06(unittest.TestCase):
         self.assertEqual(blocks[0], ["1", "+"])
         self.assertEqual(blocks[1], ["2", "+"])
 
+    def test_build_occupancy_map(self):
+        self.assertEqual(day06.build_occupancy_map(["1  2", " + *"]), [True, True, False, True])
+        self.assertEqual(day06.define_spans(day06.build_occupancy_map(["1  2", " + *"])),
+                         day06.mask_to_spans(0b1011))
+
+    def test_extract_problem_blocks_bytes(self):
+        blocks, spans = day06.extract_problem_blocks_bytes(b"12 3\r\n4  56\n+  *")
+        self.assertEqual(spans, [(0, 2), (3, 5)])
+        self.assertEqual(list(blocks[0]), ["12", "4 ", "+ "])
+        # Rows shorter than the block are padded like read_grid_padded
+        self.assertEqual(list(blocks[1]), ["3 ", "56", "* "])
+        self.assertEqual(bytes(blocks[1].row_bytes(0)), b"3")
+        # The decoded rows are cached on the view
+        self.assertIs(blocks[1].text_rows(), blocks[1].text_rows())
+
+    def test_split_rows(self):
+        data = b"12 3\r\n\n 4\n+ *"
+        self.assertEqual(day06.split_rows(data), [(0, 4), (6, 6), (7, 9), (10, 13)])
+        self.assertEqual(day06.split_rows(memoryview(data)), day06.split_rows(data))
+        self.assertEqual(day06.split_rows(b"1\n"), [(0, 1)])
+        self.assertEqual(day06.split_rows(b""), [])
+
+    def test_extract_problem_blocks_bytes_matches_lines(self):
+        lines = day06.utils.read_grid_padded(day06.INPUT_FILE_PATH)
+        expected_blocks, expected_spans = day06.extract_problem_blocks(lines)
+        blocks, spans = day06.extract_problem_blocks_bytes(day06.utils.read_input_bytes(day06.INPUT_FILE_PATH))
+        self.assertEqual(spans, expected_spans)
+        self.assertEqual([list(block) for block in blocks], expected_blocks)
+
+    def test_iter_worksheet_results(self):
+        chunks = [b"12  3\n 4  56\r\n", b"+   * \n"]
+        # Block 1: 12 + 4 = 16 and columns 1 + 24 = 25; block 2: 3 * 56 = 168 and columns 6 * 35 = 210
+        self.assertEqual(list(day06.iter_worksheet_results(chunks)), [(16, 25), (168, 210)])
+
+    def test_evaluate_worksheet_streaming(self):
+        lines = day06.utils.read_grid_padded(day06.INPUT_FILE_PATH)
+        problem_blocks, _ = day06.extract_problem_blocks(lines)
+        expected = (sum(day06.solve_part1_block(block) for block in problem_blocks),
+                    sum(day06.solve_part2_block(block) for block in problem_blocks))
+        # Small bands make the rows arrive over many chunks
+        self.assertEqual(day06.evaluate_worksheet_streaming(day06.INPUT_FILE_PATH, chunk_size=1000), expected)
+
+    def test_decode_problem_block(self):
+        self.assertEqual(day06.decode_problem_block(["12", " 4", "* "]), ('*', (12, 4), (24, 1)))
+        self.assertEqual(day06.decode_problem_block(["1 ", "  ", "+ "]), ('+', (1,), (1,)))
+        self.assertEqual(day06.transpose_digit_columns([b"12 ", b" 45"]), [b"1", b"24", b"5"])
+
+    def test_decoded_views_match_decoded_lines(self):
+        blocks, _ = day06.extract_problem_blocks_bytes(b"12  3\n 4   \n 56 7\n+   * \n")
+        self.assertEqual(day06.decode_problem_blocks(blocks),
+                         [day06.decode_problem_block(list(block)) for block in blocks])
+        lines = day06.utils.read_grid_padded(day06.INPUT_FILE_PATH)
+        problem_blocks, _ = day06.extract_problem_blocks(lines)
+        views, _ = day06.extract_problem_blocks_bytes(day06.utils.read_input_bytes(day06.INPUT_FILE_PATH))
+        self.assertEqual(day06.decode_problem_blocks(views), day06.decode_problem_blocks(problem_blocks))
+
+    def test_decoded_blocks_match_block_solvers(self):
+        lines = day06.utils.read_grid_padded(day06.INPUT_FILE_PATH)
+        problem_blocks, _ = day06.extract_problem_blocks(lines)
+        for block, (operator, row_operands, column_operands) in zip(problem_blocks,
+                                                                    day06.decode_problem_blocks(problem_blocks)):
+            self.assertEqual(day06._apply_operator(operator, row_operands), day06.solve_part1_block(block))
+            self.assertEqual(day06._apply_operator(operator, column_operands), day06.solve_part2_block(block))
+
+    def test_product_tree(self):
+        rng = random.Random(10)
+        numbers = [rng.randint(1, 10 ** 30) for _ in range(101)]
+        self.assertEqual(day06.product_tree(numbers), math.prod(numbers))
+        self.assertEqual(day06.product_tree([]), 1)
+        self.assertEqual(day06.evaluate_operands('*', numbers), math.prod(numbers))
+        self.assertEqual(day06.evaluate_operands('*', [3, 5, 7]), 105)
+
+    def test_estimate_block_cost(self):
+        # Only big multiplications count, sums and single operands are free
+        self.assertGreater(day06.estimate_block_cost('*', [10 ** 5000] * 4), day06.estimate_block_cost('*', [9] * 100))
+        self.assertEqual(day06.estimate_block_cost('+', [10 ** 5000] * 4), 0)
+        self.assertEqual(day06.estimate_block_cost('*', [10 ** 5000]), 0)
+
+    def test_split_contiguous(self):
+        ranges = day06.split_contiguous([10, 1, 7, 3, 3, 8], 3)
+        self.assertEqual(ranges, [(0, 1), (1, 4), (4, 6)])
+        self.assertEqual(day06.split_contiguous([0, 0, 0], 4), [(0, 3)])
+        self.assertEqual(day06.split_contiguous([], 4), [])
+
+    def test_evaluate_blocks_parallel(self):
+        lines = day06.utils.read_grid_padded(day06.INPUT_FILE_PATH)
+        problem_blocks, _ = day06.extract_problem_blocks(lines)
+        decoded_blocks = day06.decode_problem_blocks(problem_blocks)
+        self.assertEqual(day06.evaluate_blocks_parallel(decoded_blocks, part=1, workers=2, min_cost=0),
+                         sum(day06.solve_part1_block(block) for block in problem_blocks))
+        self.assertEqual(day06.evaluate_blocks_parallel(decoded_blocks, part=2, workers=2, min_cost=0),
+                         sum(day06.solve_part2_block(block) for block in problem_blocks))
+        # Below the cost threshold the blocks are evaluated in this process
+        self.assertEqual(day06.evaluate_blocks_parallel(decoded_blocks, part=2, workers=2),
+                         sum(day06.solve_part2_block(block) for block in problem_blocks))
+
     def test_part01_execution(self):
         lines = day06.utils.read_grid_padded(day06.INPUT_FILE_PATH)
         problem_blocks, _ = day06.extract_problem_blocks(lines)
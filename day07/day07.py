@@ -1,7 +1,7 @@
 
 import os
 import sys
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
 
 # Add parent directory to path to import utils
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -10,12 +10,12 @@ import utils
 script_dir = os.path.dirname(os.path.abspath(__file__))
 INPUT_FILE_PATH = os.path.join(script_dir, 'PuzzleInput.txt')
 
-def find_char_position(lines: List[str], char: str) -> Tuple[int, int]:
+def find_char_position(lines: Sequence[str], char: str) -> Tuple[int, int]:
     """
     Finds the first occurrence of a character in the grid.
 
     Args:
-        lines: The grid lines.
+        lines: The grid lines (list of strings or a utils.MappedGrid).
         char: The character to search for.
 
     Returns:
@@ -33,12 +33,12 @@ def find_char_position(lines: List[str], char: str) -> Tuple[int, int]:
     
     return -1, -1
 
-def run_simulation(lines: List[str], start_position: Tuple[int, int]) -> Tuple[int, int]:
+def run_simulation(lines: Sequence[str], start_position: Tuple[int, int]) -> Tuple[int, int]:
     """
     Simulates the tachyon particle dynamics to calculate both split events and active timelines.
     
     Args:
-        lines: The grid lines.
+        lines: The grid lines (list of strings or a utils.MappedGrid).
         start_position: Tuple (start_col, start_row).
     
     Returns:
@@ -73,7 +73,79 @@ def run_simulation(lines: List[str], start_position: Tuple[int, int]) -> Tuple[i
 
     return total_splits, sum(active_states.values())
 
-def part01(lines: List[str]) -> None:
+def find_splitter_columns(lines: Sequence[str], splitter: str = '^') -> List[List[int]]:
+    """
+    Lists the splitter columns of every row.
+
+    Args:
+        lines: The grid lines (list of strings or a utils.MappedGrid).
+        splitter: The splitter character.
+
+    Returns:
+        For each row, the increasing columns holding a splitter.
+    """
+    splitter_columns = []
+    for line in lines:
+        columns = []
+        col = line.find(splitter)
+        while col != -1:
+            columns.append(col)
+            col = line.find(splitter, col + 1)
+        splitter_columns.append(columns)
+    return splitter_columns
+
+def run_simulation_dense(lines: Sequence[str], start_position: Tuple[int, int]) -> Tuple[int, int]:
+    """
+    Simulates the tachyon beams on a dense array of timeline counts.
+
+    Same result as run_simulation. The counts live in one list indexed by
+    column + 1, so the columns -1 and width (where a beam leaves a splitter at
+    the edge) have a slot too. Beams pass through empty cells without any
+    work. Each row only visits its precomputed splitter columns: their counts
+    are read first, cleared, and then added to both neighbours, so adjacent
+    splitters see the counts from before the row. Beams outside the row are
+    dropped before the row is processed, like the bounds check of
+    run_simulation, and beams leaving the last row are still counted. The
+    counts are Python ints, so timeline totals never overflow.
+
+    Args:
+        lines: The grid lines (list of strings or a utils.MappedGrid).
+        start_position: Tuple (start_col, start_row).
+
+    Returns:
+        A tuple (total_splits, total_timelines).
+    """
+    start_col, start_row = start_position
+    height = len(lines)
+    rows = range(start_row + 1, height)
+    widths = [len(lines[r]) for r in rows]
+    splitter_columns = find_splitter_columns([lines[r] for r in rows])
+
+    if start_col < -1:
+        # Left of every slot: the beam is dropped by the first row, if there is one
+        return 0, 0 if widths else 1
+
+    size = max(widths + [start_col + 1]) + 2
+    counts = [0] * size
+    counts[start_col + 1] = 1
+
+    total_splits = 0
+    for width, columns in zip(widths, splitter_columns):
+        counts[0] = 0
+        counts[width + 1:] = [0] * (size - width - 1)
+
+        split_counts = [counts[col + 1] for col in columns]
+        for col in columns:
+            counts[col + 1] = 0
+        for col, count in zip(columns, split_counts):
+            if count:
+                total_splits += 1
+                counts[col] += count
+                counts[col + 2] += count
+
+    return total_splits, sum(counts)
+
+def part01(lines: Sequence[str]) -> None:
     """
     Solves Day 7 Part 1: Count total tachyon beam splits.
     """
@@ -88,11 +160,11 @@ def part01(lines: List[str]) -> None:
         print("Start position 'S' not found.")
         return
 
-    total_splits, _ = run_simulation(lines, (start_col, start_row))
+    total_splits, _ = run_simulation_dense(lines, (start_col, start_row))
     
     print(f"Total Splits: {total_splits}")
 
-def part02(lines: List[str]) -> None:
+def part02(lines: Sequence[str]) -> None:
     """
     Solves Day 7 Part 2: Count total active timelines (paths).
     """
@@ -107,7 +179,7 @@ def part02(lines: List[str]) -> None:
         print("Start position 'S' not found.")
         return
 
-    _, total_timelines = run_simulation(lines, (start_col, start_row))
+    _, total_timelines = run_simulation_dense(lines, (start_col, start_row))
     
     print(f"Total Timelines: {total_timelines}")
 
@@ -115,9 +187,9 @@ def main() -> None:
     """
     Main function to run the solution.
     """
-    lines = utils.read_grid_padded(INPUT_FILE_PATH)
-    part01(lines)
-    part02(lines)
+    with utils.MappedGrid(INPUT_FILE_PATH) as grid:
+        part01(grid)
+        part02(grid)
 
 if __name__ == "__main__":
     main()
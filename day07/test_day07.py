@@ -1,5 +1,6 @@
 import unittest
 import os
+import random
 import sys
 
 # Add current directory to path
@@ -47,6 +48,29 @@ class TestDay07(unittest.TestCase):
         _, timelines = day07.run_simulation(lines, (2, 0))
         self.assertEqual(timelines, 2)
 
+    def test_run_simulation_mapped_grid(self):
+        # The memory-mapped grid must give the same results as the padded lines
+        lines = day07.utils.read_grid_padded(day07.INPUT_FILE_PATH)
+        start = day07.find_char_position(lines, 'S')
+        with day07.utils.MappedGrid(day07.INPUT_FILE_PATH) as grid:
+            self.assertEqual(day07.find_char_position(grid, 'S'), start)
+            self.assertEqual(day07.run_simulation(grid, start), day07.run_simulation(lines, start))
+
+    def test_find_splitter_columns(self):
+        self.assertEqual(day07.find_splitter_columns(["..^.^", "", "^^"]), [[2, 4], [], [0, 1]])
+
+    def test_run_simulation_dense_matches_dict(self):
+        lines = day07.utils.read_grid_padded(day07.INPUT_FILE_PATH)
+        start = day07.find_char_position(lines, 'S')
+        self.assertEqual(day07.run_simulation_dense(lines, start), day07.run_simulation(lines, start))
+
+        # Ragged rows, edge splitters and adjacent splitters
+        rng = random.Random(7)
+        for _ in range(500):
+            rows = ["".join(rng.choice("..^") for _ in range(rng.randint(0, 7))) for _ in range(rng.randint(1, 8))]
+            start = (rng.randint(-2, 8), rng.randint(0, len(rows) - 1))
+            self.assertEqual(day07.run_simulation_dense(rows, start), day07.run_simulation(rows, start))
+
     def test_part01_execution(self):
         lines = day07.utils.read_grid_padded(day07.INPUT_FILE_PATH)
         try:
@@ -1,7 +1,7 @@
 import os
 import sys
 import math
-from typing import List, Tuple, TypeAlias
+from typing import Iterable, List, Tuple, TypeAlias
 
 # Add parent directory to path to import utils
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -110,12 +110,12 @@ class UnionFind:
         
         return sorted(root_map.values(), reverse=True)
 
-def parse_input(lines: List[str]) -> List[Point3D]:
+def parse_input(lines: Iterable[str]) -> List[Point3D]:
     """
-    Parses list of 'x,y,z' strings into tuples of integers.
+    Parses 'x,y,z' strings into tuples of integers.
     
     Args:
-        lines: The input list of coordinates as string.
+        lines: The input coordinates as strings (a list or a lazy line iterator).
         
     Returns:
         A list of tuples representing the (x, y, z) coordinates.
@@ -163,7 +163,7 @@ def get_sorted_edges(points: List[Point3D]) -> List[Edge]:
 
     return edges
 
-def initialize_system(lines: List[str]) -> Tuple[List[Point3D], List[Edge], UnionFind]:
+def initialize_system(lines: Iterable[str]) -> Tuple[List[Point3D], List[Edge], UnionFind]:
     """
     Parses input, generates edges, and initializes the DSU structure.
     
@@ -181,7 +181,7 @@ def initialize_system(lines: List[str]) -> Tuple[List[Point3D], List[Edge], Unio
     uf = UnionFind(len(points))
     return points, sorted_edges, uf
 
-def solve_part1(lines: List[str], max_connections: int = DEFAULT_MAX_CONNECTIONS) -> int:
+def solve_part1(lines: Iterable[str], max_connections: int = DEFAULT_MAX_CONNECTIONS) -> int:
     """
     Solves the Day 8 Part 1 puzzle.
     
@@ -214,7 +214,7 @@ def solve_part1(lines: List[str], max_connections: int = DEFAULT_MAX_CONNECTIONS
     
     return sizes[0] * sizes[1] * sizes[2]
 
-def solve_part2(lines: List[str]) -> int:
+def solve_part2(lines: Iterable[str]) -> int:
     """
     Solves the Day 8 Part 2 puzzle.
     
@@ -241,14 +241,12 @@ def solve_part2(lines: List[str]) -> int:
 
 def main():
     """Main execution function."""
-    input_lines = utils.read_input_file(INPUT_FILE_PATH)
-    
     print("Advent of Code 2025 - Day 8 - Part 1")
-    result1 = solve_part1(input_lines)
+    result1 = solve_part1(utils.iter_input_lines(INPUT_FILE_PATH))
     print(f"Product of three largest circuits: {result1}")
 
     print("Advent of Code 2025 - Day 8 - Part 2")
-    result2 = solve_part2(input_lines)
+    result2 = solve_part2(utils.iter_input_lines(INPUT_FILE_PATH))
     print(f"Product of X coordinates of last connection: {result2}")
 
 if __name__ == "__main__":
@@ -2,7 +2,7 @@ import os
 import sys
 import re
 from fractions import Fraction
-from typing import List, Tuple, TypeAlias
+from typing import Iterable, List, Tuple, TypeAlias
 
 # Add parent directory to path to import utils
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -284,12 +284,12 @@ def find_min_presses_for_joltages(target_joltages: List[int], buttons: List[int]
 
     return solve_recursive_search(free_vars, pivot_cols, matrix, num_buttons, buttons, target_joltages)
 
-def calculate_total_min_presses(lines: List[str]) -> int:
+def calculate_total_min_presses(lines: Iterable[str]) -> int:
     """
     Calculates the total minimum button presses required for all machines described in the lines.
 
     Args:
-        lines: A list of strings, where each string describes a machine.
+        lines: Strings (a list or a lazy line iterator), where each string describes a machine.
 
     Returns:
         The sum of minimum button presses required for all solvable machines.
@@ -309,13 +309,13 @@ def calculate_total_min_presses(lines: List[str]) -> int:
     
     return total_presses
 
-def calculate_total_min_presses_for_joltages(lines: List[str]) -> int:
+def calculate_total_min_presses_for_joltages(lines: Iterable[str]) -> int:
     """
     Calculates the total minimum button presses required for Part 2 (joltage counters) 
     for all machines described in the lines.
 
     Args:
-        lines: A list of strings, where each string describes a machine.
+        lines: Strings (a list or a lazy line iterator), where each string describes a machine.
 
     Returns:
         The sum of minimum button presses required for all solvable machines.
@@ -335,7 +335,7 @@ def calculate_total_min_presses_for_joltages(lines: List[str]) -> int:
 
     return total_presses
 
-def part01(lines: List[str]) -> None:
+def part01(lines: Iterable[str]) -> None:
     """
     Executes Part 1 of the Day 10 puzzle.
     Calculates the total fewest presses required to configure all machines.
@@ -346,7 +346,7 @@ def part01(lines: List[str]) -> None:
             
     print(f"Total fewest presses required: {total_presses}")
 
-def part02(lines: List[str]) -> None:
+def part02(lines: Iterable[str]) -> None:
     """
     Executes Part 2 of the Day 10 puzzle.
     """
@@ -362,9 +362,8 @@ def main():
         print(f"Error: Input file not found at {INPUT_FILE_PATH}")
         return
         
-    input_lines = utils.read_input_file(INPUT_FILE_PATH)
-    part01(input_lines)
-    part02(input_lines)
+    part01(utils.iter_input_lines(INPUT_FILE_PATH))
+    part02(utils.iter_input_lines(INPUT_FILE_PATH))
 
 if __name__ == "__main__":
     main()
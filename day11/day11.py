@@ -1,5 +1,6 @@
 import os
 import sys
+from typing import Iterable
 
 # Add parent directory to path to import utils
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -8,12 +9,12 @@ import utils
 script_dir = os.path.dirname(os.path.abspath(__file__))
 INPUT_FILE_PATH = os.path.join(script_dir, 'PuzzleInput.txt')
 
-def parse_input(data: list[str]) -> dict[str, list[str]]:
+def parse_input(data: Iterable[str]) -> dict[str, list[str]]:
     """
     Parses the input data into an adjacency list representing the device connections.
     
     Args:
-        data (list[str]): The lines of the input file.
+        data (Iterable[str]): The lines of the input file (a list or a lazy line iterator).
         
     Returns:
         dict[str, list[str]]: A dictionary where keys are device names and values are lists of target devices.
@@ -75,11 +76,11 @@ def count_paths(graph: dict[str, list[str]], start: str, end: str) -> int:
 
     return dfs(start)
 
-def part01(input_lines: list[str]) -> None:
+def part01(input_lines: Iterable[str]) -> None:
     """Executes Part 1 of the Advent of Code Day 11 puzzle.
 
     Args:
-        input_lines (list[str]): The list of input lines.
+        input_lines (Iterable[str]): The input lines.
     """
     print("Advent of Code 2025 - Day 11 - Part 1")
     graph = parse_input(input_lines)
@@ -89,11 +90,11 @@ def part01(input_lines: list[str]) -> None:
     except ValueError as e:
         print(f"Error: {e}")
 
-def part02(input_lines: list[str]) -> None:
+def part02(input_lines: Iterable[str]) -> None:
     """Executes Part 2 of the Advent of Code Day 11 puzzle.
 
     Args:
-        input_lines (list[str]): The list of input lines.
+        input_lines (Iterable[str]): The input lines.
     """
     print("Advent of Code 2025 - Day 11 - Part 2")
     graph = parse_input(input_lines)
@@ -115,10 +116,8 @@ def part02(input_lines: list[str]) -> None:
 
 def main() -> None:
     """Main function to run the Advent of Code Day 11 solutions."""
-    input_lines = utils.read_input_file(INPUT_FILE_PATH)
-    
-    part01(input_lines)
-    part02(input_lines)
+    part01(utils.iter_input_lines(INPUT_FILE_PATH))
+    part02(utils.iter_input_lines(INPUT_FILE_PATH))
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,329 @@
+import argparse
+import math
+import random
+import string
+import sys
+from typing import Callable, Dict, Iterator, List, Optional, TextIO, TypeAlias
+
+SUPPORTED_SCALES = (1, 10, 100, 1000)
+DEFAULT_SEED = 2025
+
+# A generator takes (scale, rng) and yields the lines of a valid puzzle input.
+InputGenerator: TypeAlias = Callable[[int, random.Random], Iterator[str]]
+
+def _scaled_side(base_side: int, scale: int) -> int:
+    """Grows one side of a square grid so that its area grows by `scale`."""
+    return max(1, round(base_side * math.sqrt(scale)))
+
+def generate_day01(scale: int, rng: random.Random) -> Iterator[str]:
+    """
+    Yields dial moves such as 'L68' or 'R48'.
+
+    The bundled input has ~4200 moves with distances below 1000.
+    """
+    for _ in range(4188 * scale):
+        yield f"{rng.choice('LR')}{rng.randint(1, 999)}"
+
+def generate_day02(scale: int, rng: random.Random) -> Iterator[str]:
+    """
+    Yields a single line of comma-separated 'start-end' ID ranges.
+
+    Both the number of ranges and their width grow with the scale, and the
+    largest IDs gain one digit per factor of ten (capped at 18 digits).
+    """
+    max_digits = min(18, 10 + round(math.log10(scale)))
+    max_width = 250_000 * scale
+    ranges: List[str] = []
+    for _ in range(30 * scale):
+        num_digits = rng.randint(1, max_digits)
+        start = rng.randint(10 ** (num_digits - 1), 10 ** num_digits - 1)
+        end = min(10 ** 18 - 1, start + rng.randint(0, max_width))
+        ranges.append(f"{start}-{end}")
+    yield ','.join(ranges)
+
+def generate_day03(scale: int, rng: random.Random) -> Iterator[str]:
+    """Yields battery banks: lines of 100 digits between 1 and 9."""
+    for _ in range(200 * scale):
+        yield ''.join(rng.choices('123456789', k=100))
+
+def generate_day04(scale: int, rng: random.Random) -> Iterator[str]:
+    """Yields a square grid of paper rolls ('@') and empty floor ('.')."""
+    side = _scaled_side(137, scale)
+    for _ in range(side):
+        yield ''.join('@' if rng.random() < 0.65 else '.' for _ in range(side))
+
+def generate_day05(scale: int, rng: random.Random) -> Iterator[str]:
+    """Yields fresh ID ranges, a blank line, then available ingredient IDs."""
+    max_id = 500_000_000_000_000
+    for _ in range(188 * scale):
+        start = rng.randint(1, max_id)
+        yield f"{start}-{start + rng.randint(0, 5_000_000_000_000)}"
+    yield ""
+    for _ in range(1000 * scale):
+        yield str(rng.randint(1, max_id))
+
+def generate_day06(scale: int, rng: random.Random) -> Iterator[str]:
+    """
+    Yields a worksheet of four number rows and one operator row.
+
+    Problems are blocks of columns separated by a blank column. Within a block,
+    numbers are all left- or all right-aligned and at least one number spans
+    the full block width, so no blank column appears inside a block.
+    """
+    num_rows = 4
+    rows: List[List[str]] = [[] for _ in range(num_rows + 1)]
+    for _ in range(1000 * scale):
+        width = rng.randint(1, 4)
+        lengths = [rng.randint(1, width) for _ in range(num_rows)]
+        lengths[rng.randrange(num_rows)] = width
+        right_aligned = rng.random() < 0.5
+        for row, length in zip(rows, lengths):
+            number = str(rng.randint(10 ** (length - 1), 10 ** length - 1))
+            row.append(number.rjust(width) if right_aligned else number.ljust(width))
+        rows[num_rows].append(rng.choice('+*').ljust(width))
+    for row in rows:
+        yield ' '.join(row)
+
+def generate_day07(scale: int, rng: random.Random) -> Iterator[str]:
+    """
+    Yields a tachyon manifold with 'S' on the top row and '^' splitters.
+
+    Like the bundled input, splitters only appear on even rows and inside the
+    cone the beam can reach, on alternating columns.
+    """
+    half = _scaled_side(70, scale)
+    width = 2 * half + 1
+    height = 2 * half + 2
+    start_col = half
+
+    top = ['.'] * width
+    top[start_col] = 'S'
+    yield ''.join(top)
+    for row in range(1, height):
+        cells = ['.'] * width
+        level = row // 2
+        if row % 2 == 0 and level >= 1:
+            for j in range(level):
+                col = start_col - (level - 1) + 2 * j
+                if 0 <= col < width and rng.random() < 0.7:
+                    cells[col] = '^'
+        yield ''.join(cells)
+
+def generate_day08(scale: int, rng: random.Random) -> Iterator[str]:
+    """Yields 3D junction box coordinates 'x,y,z' in [0, 99999]."""
+    for _ in range(1000 * scale):
+        yield f"{rng.randint(0, 99999)},{rng.randint(0, 99999)},{rng.randint(0, 99999)}"
+
+def generate_day09(scale: int, rng: random.Random) -> Iterator[str]:
+    """
+    Yields the vertices of a simple rectilinear polygon, in order.
+
+    The polygon is a histogram: a flat bottom edge and a staircase top made of
+    bars with strictly increasing x and alternating heights, so consecutive
+    vertices always share an x or a y coordinate.
+    """
+    num_bars = max(1, 496 * scale // 2 - 1)
+    base_y = 1
+    xs = [1]
+    for _ in range(num_bars):
+        xs.append(xs[-1] + rng.randint(1, 200))
+    heights: List[int] = []
+    for _ in range(num_bars):
+        height = rng.randint(base_y + 1, 100_000)
+        while heights and height == heights[-1]:
+            height = rng.randint(base_y + 1, 100_000)
+        heights.append(height)
+
+    yield f"{xs[0]},{base_y}"
+    for i, height in enumerate(heights):
+        yield f"{xs[i]},{height}"
+        yield f"{xs[i + 1]},{height}"
+    yield f"{xs[-1]},{base_y}"
+
+def generate_day10(scale: int, rng: random.Random) -> Iterator[str]:
+    """
+    Yields machine descriptions '[.##.] (3) (1,3) ... {3,5,4,7}'.
+
+    The light diagram and joltages are derived from random button presses, so
+    every machine has a solution for both parts.
+    """
+    for _ in range(198 * scale):
+        num_lights = rng.randint(4, 10)
+        num_buttons = rng.randint(num_lights - 2, num_lights + 2)
+        buttons: List[List[int]] = []
+        while len(buttons) < num_buttons:
+            size = rng.randint(1, num_lights // 2 + 1)
+            button = sorted(rng.sample(range(num_lights), size))
+            if button not in buttons:
+                buttons.append(button)
+        # Make sure every light is wired to at least one button
+        for light in range(num_lights):
+            if not any(light in button for button in buttons):
+                buttons[rng.randrange(num_buttons)].append(light)
+                buttons = [sorted(button) for button in buttons]
+
+        lights = [False] * num_lights
+        joltages = [0] * num_lights
+        for button in buttons:
+            if rng.random() < 0.5:
+                for light in button:
+                    lights[light] = not lights[light]
+            presses = rng.randint(0, 20)
+            for light in button:
+                joltages[light] += presses
+
+        diagram = ''.join('#' if on else '.' for on in lights)
+        button_strs = ' '.join(f"({','.join(map(str, button))})" for button in buttons)
+        yield f"[{diagram}] {button_strs} {{{','.join(map(str, joltages))}}}"
+
+def generate_day11(scale: int, rng: random.Random) -> Iterator[str]:
+    """
+    Yields a deep directed acyclic graph of devices 'aaa: bbb ccc'.
+
+    Devices are laid out in topological order and only connect forward, within
+    a short window, so the longest path grows linearly with the device count.
+    Every device links to its successor, so 'you' and 'svr' reach 'out' through
+    'dac' and then 'fft'.
+    """
+    num_nodes = 546 * scale
+    name_length = max(3, math.ceil(math.log(num_nodes * 4, 26)))
+    reserved = {'you', 'out', 'svr', 'dac', 'fft'}
+    names: List[str] = []
+    for code in rng.sample(range(26 ** name_length), num_nodes + len(reserved)):
+        name = ''
+        for _ in range(name_length):
+            code, digit = divmod(code, 26)
+            name += string.ascii_lowercase[digit]
+        if name not in reserved:
+            names.append(name)
+    names = names[:num_nodes]
+    names[0] = 'svr'
+    names[num_nodes // 10] = 'you'
+    names[num_nodes // 3] = 'dac'
+    names[2 * num_nodes // 3] = 'fft'
+    names[-1] = 'out'
+
+    window = 20
+    lines: List[str] = []
+    for i in range(num_nodes - 1):
+        last = min(num_nodes - 1, i + window)
+        targets = {i + 1}
+        for _ in range(rng.randint(0, 3)):
+            targets.add(rng.randint(i + 1, last))
+        lines.append(f"{names[i]}: {' '.join(names[t] for t in sorted(targets))}")
+    rng.shuffle(lines)
+    yield from lines
+
+def generate_day12(scale: int, rng: random.Random) -> Iterator[str]:
+    """
+    Yields six 3x3 present shapes followed by region tasks 'WxH: c0 c1 ...'.
+
+    Like the bundled input, each region is either loosely packed (60-75% of its
+    area is needed) or needs just over 100% of its area, giving a mix of regions
+    that fit and regions that cannot.
+    """
+    num_shapes = 6
+    areas: List[int] = []
+    for idx in range(num_shapes):
+        cells = set(rng.sample(range(9), rng.randint(5, 8)))
+        # Keep the shape 3x3 wide so it matches the bundled shapes' footprint
+        cells.update({0, 8})
+        areas.append(len(cells))
+        yield f"{idx}:"
+        for r in range(3):
+            yield ''.join('#' if r * 3 + c in cells else '.' for c in range(3))
+        yield ""
+
+    for _ in range(1000 * scale):
+        width = rng.randint(35, 50)
+        height = rng.randint(35, 50)
+        region_area = width * height
+        oversubscribed = rng.random() < 0.5
+        budget = region_area * rng.uniform(0.6, 0.75)
+        counts = [0] * num_shapes
+        filled = 0
+        while True:
+            idx = rng.randrange(num_shapes)
+            if oversubscribed:
+                if filled > region_area:
+                    break
+            elif filled + areas[idx] > budget:
+                break
+            counts[idx] += 1
+            filled += areas[idx]
+        yield f"{width}x{height}: {' '.join(map(str, counts))}"
+
+GENERATORS: Dict[int, InputGenerator] = {
+    1: generate_day01,
+    2: generate_day02,
+    3: generate_day03,
+    4: generate_day04,
+    5: generate_day05,
+    6: generate_day06,
+    7: generate_day07,
+    8: generate_day08,
+    9: generate_day09,
+    10: generate_day10,
+    11: generate_day11,
+    12: generate_day12,
+}
+
+def generate_lines(day: int, scale: int, seed: int = DEFAULT_SEED) -> Iterator[str]:
+    """
+    Yields the lines of a synthetic input for a day.
+
+    Args:
+        day: The day number (1-12).
+        scale: Size factor relative to the bundled PuzzleInput.txt (1 is roughly the same size).
+        seed: Seed for the random generator; the same seed always yields the same input.
+
+    Returns:
+        An iterator over the input lines (without newlines).
+    """
+    if day not in GENERATORS:
+        raise ValueError(f"Unknown day: {day}")
+    if scale < 1:
+        raise ValueError(f"Scale must be a positive integer: {scale}")
+    return GENERATORS[day](scale, random.Random(seed))
+
+def write_input(day: int, scale: int, seed: int, file: TextIO) -> int:
+    """
+    Streams a synthetic input to an open text file.
+
+    Args:
+        day: The day number (1-12).
+        scale: Size factor relative to the bundled input.
+        seed: Seed for the random generator.
+        file: The destination file object.
+
+    Returns:
+        The number of lines written.
+    """
+    count = 0
+    for line in generate_lines(day, scale, seed):
+        file.write(line)
+        file.write('\n')
+        count += 1
+    return count
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate scaled synthetic Advent of Code 2025 inputs.")
+    parser.add_argument('day', type=int, choices=sorted(GENERATORS), help="Day to generate an input for.")
+    parser.add_argument('--scale', type=int, default=10, choices=SUPPORTED_SCALES,
+                        help="Size factor relative to the bundled input (default: 10).")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED,
+                        help=f"Random seed (default: {DEFAULT_SEED}).")
+    parser.add_argument('-o', '--output', help="Output file (default: standard output).")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Writes the requested synthetic input to a file or to standard output."""
+    args = parse_args(argv)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            write_input(args.day, args.scale, args.seed, file)
+    else:
+        write_input(args.day, args.scale, args.seed, sys.stdout)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,343 @@
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeAlias
+
+try:
+    import resource
+except ImportError:  # The resource module is POSIX only (e.g. missing on Windows)
+    resource = None
+
+import utils
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+ALL_DAYS = list(range(1, 13))
+
+# A parser takes (day_module, input_path) and returns the data handed to every part.
+ParseFunc: TypeAlias = Callable[[Any, str], Any]
+# A part takes (day_module, parsed_data) and returns its result (or prints it).
+PartFunc: TypeAlias = Callable[[Any, Any], Any]
+DaySpec: TypeAlias = Tuple[ParseFunc, List[Tuple[str, PartFunc]]]
+PartReport: TypeAlias = Dict[str, Any]
+
+def _parse_lines(module, path: str) -> List[str]:
+    return utils.read_input_file(path)
+
+def _parse_day01(module, path: str):
+    return module.read_signed_distances(path)
+
+def _parse_mapped_grid(module, path: str) -> utils.MappedGrid:
+    return utils.MappedGrid(path)
+
+def _parse_day02(module, path: str) -> List[Tuple[int, int]]:
+    input_lines = utils.read_input_file(path)
+    return module.parse_all_ranges(module.split_by_comma(input_lines[0]))
+
+def _parse_day03(module, path: str):
+    return module.DigitMatrix.from_bytes(utils.read_input_bytes(path))
+
+def _parse_day05(module, path: str) -> Tuple[Any, List[int]]:
+    fresh_ranges, available_ids = module.parse_inventory_data(utils.read_input_file(path))
+    return module.IntervalIndex.from_ranges(fresh_ranges), available_ids
+
+def _parse_day06(module, path: str) -> Tuple[List[Any], List[Any]]:
+    problem_blocks, _ = module.extract_problem_blocks_bytes(utils.read_input_bytes(path))
+    return problem_blocks, module.decode_problem_blocks(problem_blocks)
+
+def _standard_parts() -> List[Tuple[str, PartFunc]]:
+    return [
+        ('part01', lambda module, data: module.part01(data)),
+        ('part02', lambda module, data: module.part02(data)),
+    ]
+
+# Mirrors the parsing done by each day's main() so the parts receive the same data.
+# Days 8, 10 and 11 stream their lines in main(); here they are read into a list
+# up front so that reading the file counts as parse time rather than solve time.
+DAY_SPECS: Dict[int, DaySpec] = {
+    1: (_parse_day01, _standard_parts()),
+    2: (_parse_day02, _standard_parts()),
+    3: (_parse_day03, _standard_parts()),
+    4: (_parse_mapped_grid, _standard_parts()),
+    5: (_parse_day05, [
+        ('part01', lambda module, data: module.part01(data[0], data[1])),
+        ('part02', lambda module, data: module.part02(data[0])),
+    ]),
+    6: (_parse_day06, [
+        ('part01', lambda module, data: module.part01(data[0], data[1])),
+        ('part02', lambda module, data: module.part02(data[0], data[1])),
+    ]),
+    7: (_parse_mapped_grid, _standard_parts()),
+    8: (_parse_lines, [
+        ('solve_part1', lambda module, data: module.solve_part1(data)),
+        ('solve_part2', lambda module, data: module.solve_part2(data)),
+    ]),
+    9: (_parse_lines, _standard_parts()),
+    10: (_parse_lines, _standard_parts()),
+    11: (_parse_lines, _standard_parts()),
+    12: (_parse_lines, [
+        ('solve', lambda module, data: module.solve(data)),
+    ]),
+}
+
+def get_day_dir(day: int) -> str:
+    """Returns the directory holding the solution of the given day."""
+    return os.path.join(ROOT_DIR, f"day{day:02d}")
+
+def get_default_input_path(day: int) -> str:
+    """Returns the path of the bundled puzzle input of the given day."""
+    return os.path.join(get_day_dir(day), 'PuzzleInput.txt')
+
+def load_day_module(day: int):
+    """
+    Imports the solution module of a day (e.g. day01/day01.py) by file path.
+
+    The module is registered in sys.modules under its plain name (e.g. 'day01'),
+    matching how the unit tests import it, so repeated loads reuse the same module.
+
+    Args:
+        day: The day number (1-12).
+
+    Returns:
+        The imported module.
+    """
+    module_name = f"day{day:02d}"
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    module_path = os.path.join(get_day_dir(day), f"{module_name}.py")
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+def get_peak_rss_kib(children: bool = False) -> Optional[int]:
+    """
+    Returns a peak resident set size in KiB.
+
+    The kernel keeps this high-water mark per process and never resets it, which
+    is why each part is measured in a fresh interpreter (see run_part).
+
+    Args:
+        children: Report the largest terminated child process (e.g. a pool worker)
+            instead of the current process.
+
+    Returns:
+        The high-water mark of the process memory, or None when the platform
+        does not provide it.
+    """
+    if resource is None:
+        return None
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    peak = resource.getrusage(who).ru_maxrss
+    # macOS reports bytes, Linux reports kilobytes
+    if sys.platform == 'darwin':
+        peak //= 1024
+    return peak
+
+def _last_output_line(output: str) -> str:
+    """Extracts the last non-empty printed line, ignoring carriage-return progress updates."""
+    lines = [line.strip() for line in output.replace('\r', '\n').split('\n')]
+    non_empty = [line for line in lines if line]
+    return non_empty[-1] if non_empty else ''
+
+def timed_call(func: Callable[[], Any]) -> Tuple[Any, float, str]:
+    """
+    Calls a function while capturing anything it prints.
+
+    Args:
+        func: A zero-argument callable.
+
+    Returns:
+        A tuple (return_value, elapsed_seconds, captured_stdout).
+    """
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        start = time.perf_counter()
+        value = func()
+        elapsed = time.perf_counter() - start
+    return value, elapsed, buffer.getvalue()
+
+def measure_part(day: int, part_index: int, input_path: Optional[str] = None) -> PartReport:
+    """
+    Parses the input of a day and runs one of its parts in the current process.
+
+    The reported peaks are only meaningful in a fresh interpreter, so this is
+    normally called through run_part.
+
+    Args:
+        day: The day number (1-12).
+        part_index: The position of the part in DAY_SPECS.
+        input_path: Optional input file, defaults to the bundled PuzzleInput.txt.
+
+    Returns:
+        The report of the part (see run_day for its keys).
+    """
+    if day not in DAY_SPECS:
+        raise ValueError(f"Unknown day: {day}")
+
+    parse_func, parts = DAY_SPECS[day]
+    part_name, part_func = parts[part_index]
+    module = load_day_module(day)
+    path = input_path or get_default_input_path(day)
+
+    data, parse_seconds, _ = timed_call(lambda: parse_func(module, path))
+    try:
+        value, solve_seconds, output = timed_call(lambda: part_func(module, data))
+    finally:
+        # Memory-mapped inputs keep the file open until released
+        if hasattr(data, 'close'):
+            data.close()
+    return {
+        'day': day,
+        'part': part_name,
+        'parse_seconds': parse_seconds,
+        'solve_seconds': solve_seconds,
+        'peak_rss_kib': get_peak_rss_kib(),
+        'worker_peak_rss_kib': get_peak_rss_kib(children=True),
+        'result': value if value is not None else _last_output_line(output),
+    }
+
+def run_part(day: int, part_index: int, input_path: Optional[str] = None) -> PartReport:
+    """
+    Runs one part of a day in a fresh interpreter so its peak memory is its own.
+
+    Args:
+        day: The day number (1-12).
+        part_index: The position of the part in DAY_SPECS.
+        input_path: Optional input file, defaults to the bundled PuzzleInput.txt.
+
+    Returns:
+        The report of the part (see run_day for its keys).
+    """
+    command = [sys.executable, os.path.abspath(__file__), str(day), '--measure-part', str(part_index)]
+    if input_path:
+        command += ['--input', os.path.abspath(input_path)]
+    completed = subprocess.run(command, stdout=subprocess.PIPE, check=True, text=True)
+    return json.loads(completed.stdout)
+
+def run_day(day: int, input_path: Optional[str] = None) -> List[PartReport]:
+    """
+    Runs each part of a day, every one in its own interpreter.
+
+    Each part re-parses the input, so 'peak_rss_kib' covers exactly the parse
+    plus that part and 'worker_peak_rss_kib' the largest pool worker it started
+    (0 when it started none). Parts that print their answer instead of
+    returning it are reported with the last line they printed.
+
+    Args:
+        day: The day number (1-12).
+        input_path: Optional input file, defaults to the bundled PuzzleInput.txt.
+
+    Returns:
+        One report per part with the keys 'day', 'part', 'parse_seconds',
+        'solve_seconds', 'peak_rss_kib', 'worker_peak_rss_kib' and 'result'.
+    """
+    if day not in DAY_SPECS:
+        raise ValueError(f"Unknown day: {day}")
+
+    _, parts = DAY_SPECS[day]
+    return [run_part(day, part_index, input_path) for part_index in range(len(parts))]
+
+def run_days(days: List[int], input_path: Optional[str] = None) -> List[PartReport]:
+    """
+    Runs several days in order.
+
+    Args:
+        days: The day numbers to run.
+        input_path: Optional input file override (only meaningful for a single day).
+
+    Returns:
+        The concatenated part reports of all days.
+    """
+    reports: List[PartReport] = []
+    for day in days:
+        reports.extend(run_day(day, input_path))
+    return reports
+
+def format_columns(headers: List[str], rows: List[List[str]]) -> str:
+    """
+    Aligns string cells into a plain-text table with a header separator.
+
+    Args:
+        headers: The column titles.
+        rows: The table rows, each with one cell per header.
+
+    Returns:
+        The table as a single string.
+    """
+    widths = [max(len(row[i]) for row in [headers] + rows) for i in range(len(headers))]
+    lines = [' | '.join(cell.ljust(width) for cell, width in zip(headers, widths))]
+    lines.append('-+-'.join('-' * width for width in widths))
+    for row in rows:
+        lines.append(' | '.join(cell.ljust(width) for cell, width in zip(row, widths)))
+    return '\n'.join(lines)
+
+def format_table(reports: List[PartReport]) -> str:
+    """
+    Formats part reports as a plain-text table.
+
+    Args:
+        reports: The reports produced by run_day/run_days.
+
+    Returns:
+        The table as a single string.
+    """
+    headers = ['Day', 'Part', 'Parse (ms)', 'Solve (ms)', 'Peak RSS (MiB)', 'Worker RSS (MiB)', 'Result']
+    rows = []
+    for report in reports:
+        peaks = [report['peak_rss_kib'], report['worker_peak_rss_kib']]
+        rows.append([
+            f"{report['day']:02d}",
+            report['part'],
+            f"{report['parse_seconds'] * 1000:.2f}",
+            f"{report['solve_seconds'] * 1000:.2f}",
+            *(f"{peak / 1024:.1f}" if peak is not None else 'n/a' for peak in peaks),
+            str(report['result']),
+        ])
+
+    return format_columns(headers, rows)
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run Advent of Code 2025 solutions and report timings.")
+    parser.add_argument('days', nargs='*', type=int, default=ALL_DAYS,
+                        help="Days to run (default: all).")
+    parser.add_argument('--input', dest='input_path',
+                        help="Alternative input file (requires exactly one day).")
+    parser.add_argument('--json', action='store_true',
+                        help="Print the reports as JSON instead of a table.")
+    # Internal: used by run_part to measure a single part in a child interpreter.
+    parser.add_argument('--measure-part', type=int, metavar='INDEX', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    unknown_days = [day for day in args.days if day not in DAY_SPECS]
+    if unknown_days:
+        parser.error(f"unknown days: {unknown_days}")
+    if args.input_path and len(args.days) != 1:
+        parser.error("--input requires exactly one day")
+    if args.measure_part is not None and len(args.days) != 1:
+        parser.error("--measure-part requires exactly one day")
+    return args
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Runs the selected days and prints the timing report."""
+    args = parse_args(argv)
+    if args.measure_part is not None:
+        print(json.dumps(measure_part(args.days[0], args.measure_part, args.input_path), default=str))
+        return
+
+    reports = run_days(args.days, args.input_path)
+
+    if args.json:
+        print(json.dumps(reports, indent=2, default=str))
+    else:
+        print(format_table(reports))
+
+if __name__ == "__main__":
+    main()
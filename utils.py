@@ -1,4 +1,10 @@
-from typing import List
+import mmap
+import os
+from array import array
+from typing import Iterator, List, Optional, Tuple, Union
+
+# Default read size for the chunked byte readers (1 MiB)
+DEFAULT_CHUNK_SIZE = 1 << 20
 
 def read_input_file(file_path: str, strip_lines: bool = True) -> List[str]:
     """
@@ -18,6 +24,139 @@ def read_input_file(file_path: str, strip_lines: bool = True) -> List[str]:
         else:
             return [line.rstrip('\n') for line in file]
 
+def read_input_bytes(file_path: str) -> bytes:
+    """
+    Reads the raw bytes of a specified file in one call.
+
+    Args:
+        file_path: The path to the input file.
+
+    Returns:
+        The file contents, undecoded.
+    """
+    with open(file_path, 'rb') as file:
+        return file.read()
+
+def iter_input_lines(file_path: str, strip_lines: bool = True) -> Iterator[str]:
+    """
+    Lazily yields lines from a specified text file.
+
+    Same line handling as read_input_file, but only one line is held in memory
+    at a time, so callers can start parsing before the file is fully read.
+
+    Args:
+        file_path: The path to the input file.
+        strip_lines: If True, strips leading/trailing whitespace.
+                     If False, only strips trailing newlines (preserves indentation).
+
+    Yields:
+        Each line of the file.
+    """
+    with open(file_path, 'r', encoding='utf-8') as file:
+        if strip_lines:
+            for line in file:
+                yield line.strip()
+        else:
+            for line in file:
+                yield line.rstrip('\n')
+
+def iter_input_chunks(file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Lazily yields the raw bytes of a file in fixed-size chunks.
+
+    Chunk boundaries ignore line structure; use iter_input_line_chunks when
+    every chunk must hold whole lines.
+
+    Args:
+        file_path: The path to the input file.
+        chunk_size: The maximum number of bytes per chunk.
+
+    Yields:
+        Consecutive byte chunks of the file (the last one may be shorter).
+    """
+    with open(file_path, 'rb') as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+def iter_input_line_chunks(file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Lazily yields the raw bytes of a file in chunks made of whole lines.
+
+    Each chunk ends right after a newline (except possibly the last one), so it
+    can be split and parsed independently of its neighbours. A single line
+    longer than chunk_size is yielded as one larger chunk.
+
+    Args:
+        file_path: The path to the input file.
+        chunk_size: The approximate number of bytes per chunk.
+
+    Yields:
+        Consecutive byte chunks of the file, aligned on line boundaries.
+    """
+    remainder = b''
+    for chunk in iter_input_chunks(file_path, chunk_size):
+        chunk = remainder + chunk
+        cut = chunk.rfind(b'\n') + 1
+        if cut == 0:
+            remainder = chunk
+            continue
+        remainder = chunk[cut:]
+        yield chunk[:cut]
+    if remainder:
+        yield remainder
+
+def split_file_line_ranges(file_path: str, num_shards: int) -> List[Tuple[int, int]]:
+    """
+    Splits a file into byte ranges of about equal size, aligned on line boundaries.
+
+    Only the bytes around each cut point are read, so the ranges can be handed
+    to worker processes that read their own share of the file.
+
+    Args:
+        file_path: The path to the input file.
+        num_shards: The desired number of ranges.
+
+    Returns:
+        Consecutive (start, end) byte offsets covering the whole file. Each range
+        ends right after a newline (except possibly the last one). Fewer ranges
+        are returned when lines are longer than the shard size, and none for an
+        empty file.
+    """
+    size = os.path.getsize(file_path)
+    ranges: List[Tuple[int, int]] = []
+    start = 0
+    with open(file_path, 'rb') as file:
+        for shard in range(1, max(1, num_shards)):
+            cut = max(start, size * shard // num_shards)
+            file.seek(cut)
+            file.readline()  # Move past the line the cut point fell into
+            cut = file.tell()
+            if cut > start:
+                ranges.append((start, cut))
+                start = cut
+    if size > start:
+        ranges.append((start, size))
+    return ranges
+
+def read_file_range(file_path: str, start: int, end: int) -> bytes:
+    """
+    Reads the bytes of a file between two offsets.
+
+    Args:
+        file_path: The path to the input file.
+        start: The first byte offset (inclusive).
+        end: The last byte offset (exclusive).
+
+    Returns:
+        The raw bytes of the range.
+    """
+    with open(file_path, 'rb') as file:
+        file.seek(start)
+        return file.read(end - start)
+
 def read_grid_padded(file_path: str) -> List[str]:
     """
     Reads lines from a file, preserving whitespace and padding to max length.
@@ -38,3 +177,171 @@ def read_grid_padded(file_path: str) -> List[str]:
     # Pad lines to ensure rectangular grid
     return [line.ljust(max_len) for line in lines]
 
+class GridRow:
+    """
+    A read-only view of one row of a MappedGrid.
+
+    Behaves like the padded string of the row (len, indexing, slicing, 'in',
+    find) but reads characters straight from the mapped file. Positions past
+    the end of a short line read as the grid's padding character.
+    """
+
+    __slots__ = ('_grid', '_start', '_length')
+
+    def __init__(self, grid: 'MappedGrid', start: int, length: int):
+        self._grid = grid
+        self._start = start
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._grid.width
+
+    def __getitem__(self, index: Union[int, slice]) -> str:
+        if isinstance(index, slice):
+            first, stop, step = index.indices(self._grid.width)
+            if step != 1:
+                return ''.join(self[i] for i in range(first, stop, step))
+            if stop <= first:
+                return ''
+            raw_stop = min(stop, self._length)
+            text = ''
+            if first < raw_stop:
+                text = self._grid.data[self._start + first:self._start + raw_stop].decode('latin-1')
+            return text + self._grid.pad_char * (stop - first - len(text))
+
+        width = self._grid.width
+        if index < 0:
+            index += width
+        if not 0 <= index < width:
+            raise IndexError("grid column out of range")
+        if index >= self._length:
+            return self._grid.pad_char
+        return chr(self._grid.data[self._start + index])
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self._grid.width):
+            yield self[index]
+
+    def __contains__(self, sub: str) -> bool:
+        return self.find(sub) != -1
+
+    def __str__(self) -> str:
+        return self[:]
+
+    def __repr__(self) -> str:
+        return f"GridRow({str(self)!r})"
+
+    def find(self, sub: str, start: int = 0, end: Optional[int] = None) -> int:
+        """
+        Returns the lowest column where `sub` is found, like str.find, or -1.
+
+        Searches the mapped bytes directly unless `sub` involves the padding.
+        """
+        width = self._grid.width
+        start, end, _ = slice(start, end).indices(width)
+        if self._grid.pad_char in sub:
+            return str(self).find(sub, start, end)
+        position = self._grid.data.find(sub.encode('latin-1'),
+                                        self._start + start,
+                                        self._start + min(end, self._length))
+        return position - self._start if position != -1 else -1
+
+class MappedGrid:
+    """
+    A character grid backed by a memory-mapped file.
+
+    Rows are located once by scanning for newlines; only their offsets and
+    lengths are stored. Cells, rows and columns are read from the mapped bytes
+    on demand, so the grid costs little more memory than the page cache of the
+    file itself. Ragged lines are virtually padded to the widest line, like
+    read_grid_padded, and a trailing carriage return is ignored.
+
+    Indexing the grid returns GridRow views, so code written for a list of
+    equal-length strings (grid[row][col], len(grid), len(grid[0])) runs on it
+    unchanged.
+
+    Use it as a context manager (or call close()) to release the mapping.
+    Hot loops should read whole rows (grid[row][:] or row_bytes) rather than
+    single cells, since every cell access goes through a GridRow.
+    """
+
+    def __init__(self, file_path: str, pad_char: str = ' '):
+        """
+        Maps the file and indexes its rows.
+
+        Args:
+            file_path: The path to the grid file.
+            pad_char: The character returned for positions past the end of a short line.
+        """
+        self.pad_char = pad_char
+        self._file = open(file_path, 'rb')
+        if os.fstat(self._file.fileno()).st_size > 0:
+            self.data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self.data = b''  # Empty files cannot be mapped
+
+        self._row_starts = array('q')
+        self._row_lengths = array('q')
+        size = len(self.data)
+        position = 0
+        while position < size:
+            newline = self.data.find(b'\n', position)
+            line_end = newline if newline != -1 else size
+            length = line_end - position
+            if length and self.data[line_end - 1] == 13:  # Ignore '\r' of Windows line endings
+                length -= 1
+            self._row_starts.append(position)
+            self._row_lengths.append(length)
+            position = line_end + 1
+
+        self.height = len(self._row_starts)
+        self.width = max(self._row_lengths, default=0)
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __getitem__(self, row: int) -> GridRow:
+        if row < 0:
+            row += self.height
+        if not 0 <= row < self.height:
+            raise IndexError("grid row out of range")
+        return GridRow(self, self._row_starts[row], self._row_lengths[row])
+
+    def __iter__(self) -> Iterator[GridRow]:
+        for row in range(self.height):
+            yield self[row]
+
+    def __enter__(self) -> 'MappedGrid':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def cell(self, row: int, col: int) -> str:
+        """Returns the character at (row, col), padding included."""
+        return self[row][col]
+
+    def row_bytes(self, row: int) -> memoryview:
+        """Returns a zero-copy view of the raw bytes of a row (without padding or newline)."""
+        start = self._row_starts[row]
+        return memoryview(self.data)[start:start + self._row_lengths[row]]
+
+    def column(self, col: int) -> str:
+        """Returns a column, top to bottom, as a string (padding included)."""
+        return ''.join(self[row][col] for row in range(self.height))
+
+    def close(self) -> None:
+        """
+        Releases the memory mapping and the underlying file.
+
+        An mmap cannot be closed while memoryviews of it are alive. If views
+        from row_bytes() are still referenced, the mapping is left to be
+        unmapped when the last of them is released, so those views stay
+        valid; the file itself is always closed.
+        """
+        if isinstance(self.data, mmap.mmap):
+            try:
+                self.data.close()
+            except BufferError:
+                pass
+        self._file.close()